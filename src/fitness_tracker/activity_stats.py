@@ -3,8 +3,8 @@ from __future__ import annotations
 import math
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
-from zoneinfo import ZoneInfo
 
+import numpy as np
 from loguru import logger
 from sqlalchemy import (
     BigInteger,
@@ -16,6 +16,8 @@ from sqlalchemy import (
     Integer,
     String,
     UniqueConstraint,
+    func,
+    select,
     text,
 )
 from sqlalchemy.orm import Session
@@ -33,41 +35,27 @@ from fitness_tracker.database import (
 from fitness_tracker.exporters import infer_sport
 
 if TYPE_CHECKING:
+    from sqlalchemy.engine import Row
+
     from fitness_tracker.database import DatabaseManager
 
 
-def _safe_avg(values: list[float]) -> float | None:
-    clean = [v for v in values if v is not None]
-    return sum(clean) / len(clean) if clean else None
-
-
-def _calc_elevation(samples: list) -> tuple[float, float]:
-    """Return (total_ascent_m, total_descent_m) from a list of metric rows."""
-    ascent = 0.0
-    descent = 0.0
-    prev_alt: float | None = None
-    for s in samples:
-        alt = getattr(s, "altitude_m", None)
-        if alt is None:
-            continue
-        alt = float(alt)
-        if prev_alt is not None:
-            diff = alt - prev_alt
-            if diff > 0:
-                ascent += diff
-            else:
-                descent += abs(diff)
-        prev_alt = alt
-    return ascent, descent
+def _safe_avg(values: np.ndarray) -> float | None:
+    """Mean of the non-NaN values, or None if there are none."""
+    clean = values[~np.isnan(values)]
+    return float(clean.mean()) if clean.size else None
+
+
+def _calc_elevation(altitudes: np.ndarray) -> tuple[float, float]:
+    """Return (total_ascent_m, total_descent_m) from an altitude column (NaN = missing)."""
+    diffs = np.diff(altitudes[~np.isnan(altitudes)])
+    return float(diffs[diffs > 0].sum()), abs(float(diffs[diffs < 0].sum()))
 
 
-def _last_distance(samples: list) -> float | None:
-    """Return the last non-None total_distance_m from a sample list."""
-    for s in reversed(samples):
-        d = getattr(s, "total_distance_m", None)
-        if d is not None:
-            return float(d)
-    return None
+def _last_distance(distances: np.ndarray) -> float | None:
+    """Return the last non-NaN total_distance_m from a distance column."""
+    present = np.flatnonzero(~np.isnan(distances))
+    return float(distances[present[-1]]) if present.size else None
 
 
 # ---------------------------------------------------------------------------
@@ -136,11 +124,22 @@ class StatsCalculator:
                     .order_by(Activity.start_time)
                 )
 
+            # Recorded sports for every activity in one query instead of one per row
+            sport_ids = dict(
+                session.execute(
+                    select(ActivitySport.activity_id, ActivitySport.sport_type_id),
+                ).all(),
+            )
+
             for act in query.yield_per(1000):
-                row = self._build_stats_row(session, act)
+                row = self._build_stats_row(session, act, sport_ids)
                 if row is None:
                     continue
-                self._upsert(session, row)
+                if force:
+                    self._upsert(session, row)
+                else:
+                    # The outer join already excluded activities that have stats
+                    session.add(row)
                 processed += 1
 
             session.commit()
@@ -152,60 +151,83 @@ class StatsCalculator:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _build_stats_row(self, session: Session, act: Activity) -> ActivityStats | None:
-        """Return an *unsaved* ActivityStats for *act* (None if sport unknown)."""
+    def _build_stats_row(
+        self,
+        session: Session,
+        act: Activity,
+        sport_ids: dict[int, int] | None = None,
+    ) -> ActivityStats | None:
+        """Return an *unsaved* ActivityStats for *act* (None if sport unknown).
+
+        *sport_ids* maps activity id to recorded sport type id when the caller
+        has preloaded them; otherwise the ActivitySport row is queried.
+        """
 
         # ---- Timing ----
         start = act.start_time
         if start.tzinfo is None:
-            start = start.replace(tzinfo=ZoneInfo("UTC"))
+            start = start.replace(tzinfo=UTC)
 
         if act.end_time:
             end = act.end_time
             if end.tzinfo is None:
-                end = end.replace(tzinfo=ZoneInfo("UTC"))
+                end = end.replace(tzinfo=UTC)
             duration_s = max(0, int((end - start).total_seconds()))
         else:
             end = None
             duration_s = 0
 
         # ---- Raw data ----
-        hrs: list[HeartRate] = (
-            session.query(HeartRate)
-            .filter_by(activity_id=act.id)
-            .order_by(HeartRate.timestamp_ms)
-            .all()
-        )
-        runs: list[RunningMetrics] = (
-            session.query(RunningMetrics)
-            .filter_by(activity_id=act.id)
-            .order_by(RunningMetrics.timestamp_ms)
-            .all()
-        )
-        cycles: list[CyclingMetrics] = (
-            session.query(CyclingMetrics)
-            .filter_by(activity_id=act.id)
-            .order_by(CyclingMetrics.timestamp_ms)
-            .all()
-        )
+        # Plain column rows: only what the stats below need, no ORM instances.
+        # HR only feeds aggregates, so SQLite reduces it and returns a single row.
+        hr_agg: Row = session.execute(
+            select(
+                func.count(HeartRate.id).label("samples"),
+                func.avg(HeartRate.bpm).label("avg_bpm"),
+                func.max(HeartRate.bpm).label("max_bpm"),
+                func.coalesce(func.sum(HeartRate.energy_kj), 0.0).label("total_kj"),
+            ).where(HeartRate.activity_id == act.id),
+        ).one()
+        runs: list[Row] = session.execute(
+            select(
+                RunningMetrics.cadence_spm.label("cadence"),
+                RunningMetrics.power_watts,
+                RunningMetrics.total_distance_m,
+                RunningMetrics.altitude_m,
+            )
+            .where(RunningMetrics.activity_id == act.id)
+            .order_by(RunningMetrics.timestamp_ms),
+        ).all()
+        cycles: list[Row] = session.execute(
+            select(
+                CyclingMetrics.cadence_rpm.label("cadence"),
+                CyclingMetrics.power_watts,
+                CyclingMetrics.total_distance_m,
+                CyclingMetrics.altitude_m,
+            )
+            .where(CyclingMetrics.activity_id == act.id)
+            .order_by(CyclingMetrics.timestamp_ms),
+        ).all()
 
         # ---- Sport type ----
-        sport_row = session.query(ActivitySport).filter_by(activity_id=act.id).first()
-        if sport_row:
-            sport = SportTypesEnum(sport_row.sport_type_id)
+        sport_type_id = (
+            self._recorded_sport_id(session, act.id) if sport_ids is None else sport_ids.get(act.id)
+        )
+        if sport_type_id is not None:
+            sport = SportTypesEnum(sport_type_id)
         else:
-            sport = infer_sport(hrs, runs, cycles, act.id)
+            # infer_sport only checks whether any HR samples exist
+            sport = infer_sport([hr_agg] if hr_agg.samples else [], runs, cycles, act.id)
 
         if sport == SportTypesEnum.unknown:
             logger.debug(f"Skipping activity {act.id}: unknown sport")
             return None
 
         # ---- HR stats ----
-        if hrs:
-            bpms = [h.bpm for h in hrs]
-            avg_bpm: float | None = sum(bpms) / len(bpms)
-            max_bpm: int | None = max(bpms)
-            total_kj = sum(h.energy_kj or 0.0 for h in hrs)
+        if hr_agg.samples:
+            avg_bpm: float | None = float(hr_agg.avg_bpm)
+            max_bpm: int | None = int(hr_agg.max_bpm)
+            total_kj = float(hr_agg.total_kj)
         else:
             avg_bpm = None
             max_bpm = None
@@ -214,20 +236,17 @@ class StatsCalculator:
         # ---- Sport-specific stats ----
         if sport == SportTypesEnum.running and runs:
             primary = runs
-            cadence_vals = [float(r.cadence_spm) for r in runs if r.cadence_spm is not None]
-            power_vals = [float(r.power_watts) for r in runs if r.power_watts is not None]
         elif sport == SportTypesEnum.biking and cycles:
             primary = cycles
-            cadence_vals = [float(c.cadence_rpm) for c in cycles if c.cadence_rpm is not None]
-            power_vals = [float(c.power_watts) for c in cycles if c.power_watts is not None]
         else:
             primary = []
-            cadence_vals = []
-            power_vals = []
+        # (cadence, power, distance, altitude) columns; NULLs become NaN
+        data = np.array(primary, dtype=np.float64).reshape(-1, 4)
+        cadences, powers, distances, altitudes = data.T
 
-        distance_m = _last_distance(primary)
-        avg_cadence = _safe_avg(cadence_vals)
-        avg_power = _safe_avg(power_vals)
+        distance_m = _last_distance(distances)
+        avg_cadence = _safe_avg(cadences)
+        avg_power = _safe_avg(powers)
 
         # Average speed from distance / duration (avoids storing redundant value
         # but is cheap to pre-compute so the UI doesn't have to).
@@ -237,7 +256,7 @@ class StatsCalculator:
             avg_speed_mps = None
 
         # ---- Elevation ----
-        ascent, descent = _calc_elevation(primary)
+        ascent, descent = _calc_elevation(altitudes)
 
         return ActivityStats(
             activity_id=act.id,
@@ -254,7 +273,14 @@ class StatsCalculator:
             avg_power_watts=avg_power,
             total_ascent_m=ascent if ascent > 0 else None,
             total_descent_m=descent if descent > 0 else None,
-            computed_at=datetime.now(tz=ZoneInfo("UTC")),
+            computed_at=datetime.now(tz=UTC),
+        )
+
+    @staticmethod
+    def _recorded_sport_id(session: Session, activity_id: int) -> int | None:
+        """Sport type id stored for *activity_id*, or None if it wasn't recorded."""
+        return session.scalar(
+            select(ActivitySport.sport_type_id).where(ActivitySport.activity_id == activity_id),
         )
 
     @staticmethod
@@ -1,8 +1,17 @@
+import csv
+import io
+import math
+import sqlite3
+import threading
+import time
+from array import array
 from datetime import UTC, datetime
 from enum import Enum
-from zoneinfo import ZoneInfo
+from functools import lru_cache
 
+import numpy as np
 from bleaksport.models import CyclingSample, RunningSample, TrainerSample
+from loguru import logger
 from sqlalchemy import (
     BigInteger,
     Column,
@@ -11,16 +20,21 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    SmallInteger,
     String,
     Text,
     UniqueConstraint,
     create_engine,
     event,
     exc,
+    insert,
     inspect,
+    make_url,
+    select,
     text,
 )
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from sqlalchemy.engine import Connection, Engine, Row
+from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
 
 Base = declarative_base()
 
@@ -67,16 +81,25 @@ class HeartRate(Base):
     id = Column(Integer, primary_key=True)
     activity_id = Column(Integer, ForeignKey("activities.id"), nullable=False)
     timestamp_ms = Column(BigInteger, nullable=False)
-    bpm = Column(Integer, nullable=False)
-    rr_interval = Column(Float)
-    energy_kj = Column(Float)
+    # narrow types: bpm is bounded well below 32k and rr/energy only need
+    # single precision (REAL on PostgreSQL), which shrinks rows and indexes
+    bpm = Column(SmallInteger, nullable=False)
+    rr_interval = Column(Float(precision=24))
+    energy_kj = Column(Float(precision=24))
 
     activity = relationship("Activity", back_populates="heart_rates")
 
-    # index for quick lookups by activity, and by activity+time
+    # index for quick lookups by activity, and by activity+time; on PostgreSQL
+    # the latter also carries the sample values so ordered per-activity reads
+    # (sync, export, charts) are index-only scans without heap fetches
     __table_args__ = (
         Index("ix_hr_activity_id", "activity_id"),
-        Index("ix_hr_activity_time", "activity_id", "timestamp_ms"),
+        Index(
+            "ix_hr_activity_time",
+            "activity_id",
+            "timestamp_ms",
+            postgresql_include=["bpm", "rr_interval", "energy_kj"],
+        ),
     )
 
 
@@ -198,20 +221,277 @@ class ActivityStats(Base):
 
 
 def _sqlite_pragmas(dbapi_con, _con_record) -> None:
+    cur = dbapi_con.cursor()
+    cur.execute("PRAGMA foreign_keys=ON;")
+    cur.close()
+
+
+def _sqlite_file_pragmas(dbapi_con, _con_record) -> None:
+    """Tune on-disk SQLite databases for the high-rate sensor write path.
+
+    WAL + synchronous=NORMAL drops the fsync per commit to one per checkpoint,
+    the rest keeps temp tables and the page cache in memory (64 MiB cache,
+    256 MiB mmap) and waits on a busy lock instead of failing immediately.
+    Checkpoints run every 1000 pages and the WAL file is truncated back to
+    64 MiB afterwards, so a long session doesn't leave a huge -wal behind.
+    """
     cur = dbapi_con.cursor()
     cur.execute("PRAGMA journal_mode=WAL;")
     cur.execute("PRAGMA synchronous=NORMAL;")
-    cur.execute("PRAGMA foreign_keys=ON;")
+    cur.execute("PRAGMA temp_store=MEMORY;")
+    cur.execute("PRAGMA mmap_size=268435456;")
+    cur.execute("PRAGMA cache_size=-65536;")
+    cur.execute("PRAGMA busy_timeout=5000;")
+    cur.execute("PRAGMA wal_autocheckpoint=1000;")
+    cur.execute("PRAGMA journal_size_limit=67108864;")
     cur.close()
 
 
+# Rows per multi-row INSERT. A fixed size means every full chunk reuses the
+# same SQL text, whatever the size of the batch being flushed.
+_SQLITE_INSERT_CHUNK_ROWS = 100
+
+
+@lru_cache(maxsize=32)
+def _multirow_insert_sql(table: str, columns: tuple[str, ...], rows: int) -> str:
+    # table and column names only ever come from the models in this module
+    row = f"({', '.join('?' * len(columns))})"
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([row] * rows)}"  # noqa: S608
+
+
+def _sqlite_insert_rows(conn: Connection, table: str, mappings: list[dict]) -> None:
+    """Insert *mappings* with multi-row ``INSERT ... VALUES (...), (...)`` statements.
+
+    Full chunks of a fixed row count replace a prepare/step/reset cycle per
+    row, and since they all share one SQL text it is built once and then
+    served from the driver's statement cache. Chunks stay under SQLite's
+    bound-variable limit. The remainder goes through a single-row
+    executemany so no one-off statement sizes are cached.
+    """
+    columns = tuple(mappings[0])
+    limit = conn.connection.driver_connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    step = max(1, min(_SQLITE_INSERT_CHUNK_ROWS, limit // len(columns)))
+    full = len(mappings) - len(mappings) % step
+    for start in range(0, full, step):
+        chunk = mappings[start : start + step]
+        conn.exec_driver_sql(
+            _multirow_insert_sql(table, columns, step),
+            tuple(row[c] for row in chunk for c in columns),
+        )
+    if full < len(mappings):
+        conn.exec_driver_sql(
+            _multirow_insert_sql(table, columns, 1),
+            [tuple(row[c] for c in columns) for row in mappings[full:]],
+        )
+
+
+def _bulk_insert(session: Session, model: type[Base], mappings: list[dict]) -> None:
+    """Insert *mappings* into *model*'s table inside *session*'s transaction.
+
+    PostgreSQL via psycopg2 or psycopg 3 gets a single ``COPY ... FROM STDIN``
+    on the raw driver connection, which skips per-row statement parsing and
+    SQLAlchemy parameter binding; SQLite gets multi-row VALUES statements and
+    anything else falls back to a Core executemany insert.
+    """
+    if not mappings:
+        return
+
+    conn = session.connection()
+    driver = conn.dialect.driver
+    if conn.dialect.name == "sqlite":
+        _sqlite_insert_rows(conn, model.__tablename__, mappings)
+        return
+    if conn.dialect.name != "postgresql" or driver not in ("psycopg2", "psycopg"):
+        session.execute(insert(model.__table__), mappings)
+        return
+
+    columns = list(mappings[0])
+    copy_sql = f"COPY {model.__tablename__} ({', '.join(columns)}) FROM STDIN"
+
+    cur = conn.connection.cursor()
+    try:
+        if driver == "psycopg":
+            # psycopg 3 adapts every value itself, no text encoding needed
+            with cur.copy(copy_sql) as copy:
+                for row in mappings:
+                    copy.write_row([row[c] for c in columns])
+            return
+
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for row in mappings:
+            # unquoted empty fields are read back as NULL by COPY ... CSV
+            writer.writerow(["" if row[c] is None else row[c] for c in columns])
+        buf.seek(0)
+        cur.copy_expert(f"{copy_sql} WITH (FORMAT csv)", buf)
+    finally:
+        cur.close()
+
+
+def _remote_engine_kwargs(database_dsn: str) -> dict:
+    """Extra create_engine() options for the sync target.
+
+    psycopg2 batches plain executemany() calls into multi-row statements and
+    pages INSERT..VALUES instead of doing one round-trip per row.
+    """
+    if make_url(database_dsn).drivername not in ("postgresql", "postgresql+psycopg2"):
+        return {}
+    return {
+        "executemany_mode": "values_plus_batch",
+        "insertmanyvalues_page_size": 1000,
+        "executemany_batch_page_size": 500,
+    }
+
+
+# Sample tables copied by sync_to_database, with every column except the
+# primary key and activity_id (which is remapped to the target's id).
+_SAMPLE_COLUMNS = {
+    HeartRate: ("timestamp_ms", "bpm", "rr_interval", "energy_kj"),
+    RunningMetrics: (
+        "timestamp_ms",
+        "speed_mps",
+        "cadence_spm",
+        "stride_length_m",
+        "total_distance_m",
+        "power_watts",
+        "incline_percent",
+        "altitude_m",
+    ),
+    CyclingMetrics: (
+        "timestamp_ms",
+        "speed_mps",
+        "cadence_rpm",
+        "total_distance_m",
+        "power_watts",
+        "incline_percent",
+        "altitude_m",
+    ),
+}
+
+
+def _insert_activities(session: Session, acts: list[Row]) -> list[int]:
+    """Insert copies of *acts* in one statement and return their new ids, in order."""
+    return session.scalars(
+        insert(Activity).returning(Activity.id, sort_by_parameter_order=True),
+        [{"start_time": a.start_time, "end_time": a.end_time} for a in acts],
+    ).all()
+
+
+def _copy_samples(src: Session, dst: Session, id_map: dict[int, int]) -> None:
+    """Copy sample rows of the activities in *id_map* (source id -> target id).
+
+    One ``activity_id IN (...)`` query per table covers the whole batch instead
+    of a query per activity.
+    """
+    if not id_map:
+        return
+
+    for model, columns in _SAMPLE_COLUMNS.items():
+        rows = src.execute(
+            select(model.activity_id, *(getattr(model, c) for c in columns))
+            .where(model.activity_id.in_(id_map))
+            .order_by(model.activity_id, model.timestamp_ms),
+        )
+        _bulk_insert(
+            dst,
+            model,
+            [
+                {"activity_id": id_map[row[0]], **dict(zip(columns, row[1:], strict=True))}
+                for row in rows
+            ],
+        )
+
+
+# Built once and reused for every flush; SQLAlchemy's compiled cache and the
+# driver's statement cache then see the identical statement object each time.
+_HR_INSERT = insert(HeartRate.__table__)
+_RUN_INSERT = insert(RunningMetrics.__table__)
+_CYC_INSERT = insert(CyclingMetrics.__table__)
+
+
+class _HeartRateBuffer:
+    """Column-wise staging buffer for heart rate samples.
+
+    Samples are written by index into preallocated typed arrays, so staging
+    does not allocate per sample. Missing rr/energy values are kept as NaN.
+    The arrays double in size if a flush falls behind.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._activity_id = array("q", bytes(8 * capacity))
+        self._timestamp_ms = array("q", bytes(8 * capacity))
+        self._bpm = array("H", bytes(2 * capacity))
+        self._rr = array("d", bytes(8 * capacity))
+        self._energy = array("d", bytes(8 * capacity))
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(
+        self,
+        activity_id: int,
+        timestamp_ms: int,
+        bpm: int,
+        rr: float | None,
+        energy: float | None,
+    ) -> None:
+        i = self._n
+        if i == len(self._bpm):
+            for col in (self._activity_id, self._timestamp_ms, self._bpm, self._rr, self._energy):
+                col.extend(col)
+        self._activity_id[i] = activity_id
+        self._timestamp_ms[i] = timestamp_ms
+        self._bpm[i] = bpm
+        self._rr[i] = math.nan if rr is None else rr
+        self._energy[i] = math.nan if energy is None else energy
+        self._n = i + 1
+
+    def restore(self, rows: list[dict]) -> None:
+        """Put drained *rows* back in front of anything staged since."""
+        staged = self.drain()
+        for row in (*rows, *staged):
+            self.append(
+                row["activity_id"],
+                row["timestamp_ms"],
+                row["bpm"],
+                row["rr_interval"],
+                row["energy_kj"],
+            )
+
+    def drain(self) -> list[dict]:
+        """Return the staged samples as insert mappings and empty the buffer."""
+        n, self._n = self._n, 0
+        return [
+            {
+                "activity_id": aid,
+                "timestamp_ms": ts,
+                "bpm": bpm,
+                "rr_interval": None if math.isnan(rr) else rr,
+                "energy_kj": None if math.isnan(en) else en,
+            }
+            for aid, ts, bpm, rr, en in zip(
+                self._activity_id[:n],
+                self._timestamp_ms[:n],
+                self._bpm[:n],
+                self._rr[:n],
+                self._energy[:n],
+                strict=True,
+            )
+        ]
+
+
 class DatabaseManager:
-    BATCH_SIZE = 25
+    BATCH_SIZE = 500
+    # flush staged samples at least this often so a crash loses little data
+    FLUSH_INTERVAL_S = 5.0
 
     def __init__(self, database_url: str) -> None:
         connect_args = {}
         if database_url.startswith("sqlite"):
             connect_args["check_same_thread"] = False
+            # keep prepared statements for the insert/read paths around
+            connect_args["cached_statements"] = 256
 
         self.engine = create_engine(
             database_url,
@@ -220,22 +500,50 @@ class DatabaseManager:
             connect_args=connect_args,
             pool_pre_ping=True,
         )
-        if database_url.startswith("sqlite"):
+        is_sqlite = database_url.startswith("sqlite")
+        in_memory = is_sqlite and self.engine.url.database in (None, "", ":memory:")
+        if is_sqlite:
             event.listen(self.engine, "connect", _sqlite_pragmas)
+            # in-memory databases keep SQLite's defaults
+            if not in_memory:
+                event.listen(self.engine, "connect", _sqlite_file_pragmas)
 
         Base.metadata.create_all(self.engine)
         self._migrate(self.engine)
         self.Session = sessionmaker(bind=self.engine, future=True, expire_on_commit=False)
 
-        # staging area for batching
-        self._pending_hr: list[HeartRate] = []
-        self._pending_run: list[RunningMetrics] = []
-        self._pending_cyc: list[CyclingMetrics] = []
+        # staging area for batching (plain mappings, no ORM instances)
+        self._pending_hr = _HeartRateBuffer(self.BATCH_SIZE)
+        self._pending_run: list[dict] = []
+        self._pending_cyc: list[dict] = []
+        self._last_flush = time.monotonic()
+        # samples are staged from the recorder loop but also flushed by
+        # sync_to_database() running on its own worker thread
+        self._pending_lock = threading.Lock()
+
+        # sync targets, created lazily and reused across sync_to_database() calls
+        self._remote_engines: dict[str, Engine] = {}
+        self._remote_schema_ready: set[str] = set()
+
+        # Batch and interval flushes run on one writer thread so the recorder's
+        # BLE loop never blocks on a commit. In-memory SQLite gets a separate
+        # database per thread, so it keeps flushing inline instead.
+        self._write_lock = threading.Lock()
+        self._writer_wakeup = threading.Event()
+        self._writer_stop = threading.Event()
+        self._writer: threading.Thread | None = None
+        if not in_memory:
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                name="db-writer",
+                daemon=True,
+            )
+            self._writer.start()
 
     def start_activity(self, sport_type: SportTypesEnum) -> int:
         with self.Session() as session:
             # store UTC with tzinfo
-            act = Activity(start_time=datetime.now(tz=ZoneInfo("UTC")))
+            act = Activity(start_time=datetime.now(tz=UTC))
             session.add(act)
             session.flush()  # get act.id populated
 
@@ -247,13 +555,18 @@ class DatabaseManager:
             return int(act.id)
 
     def stop_activity(self, activity_id: int) -> None:
-        # flush any leftover heart rates before closing
-        self._flush_pending()
-
-        with self.Session() as session:
-            act = session.get(Activity, activity_id)
-            act.end_time = datetime.now(tz=ZoneInfo("UTC"))
-            session.commit()
+        # leftover samples and the end_time go out in one transaction, after
+        # any batch the writer thread still has in flight
+        with self._write_lock:
+            pending = self._take_pending()
+            try:
+                with self.Session.begin() as session:
+                    self._write_pending(session, *pending)
+                    act = session.get(Activity, activity_id)
+                    act.end_time = datetime.now(tz=UTC)
+            except Exception:
+                self._restore_pending(*pending)
+                raise
 
     def list_not_uploaded(self, provider: str) -> list[Activity]:
         """All activities that have no successful upload row for this provider."""
@@ -328,6 +641,25 @@ class DatabaseManager:
                 row.payload_hash = payload_hash
             session.commit()
 
+    def heart_rate_series(self, activity_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return an activity's heart rate as columnar arrays.
+
+        Returns ``(seconds_since_first_sample, bpm)`` as float64 arrays so
+        plotting, smoothing and downsampling can run as NumPy operations
+        instead of walking row objects. Both are empty when there is no data.
+        """
+        with self.Session() as session:
+            rows = session.execute(
+                select(HeartRate.timestamp_ms, HeartRate.bpm)
+                .where(HeartRate.activity_id == activity_id)
+                .order_by(HeartRate.timestamp_ms),
+            ).all()
+        if not rows:
+            return np.empty(0), np.empty(0)
+
+        ts_ms, bpm = np.array(rows, dtype=np.float64).T
+        return (ts_ms - ts_ms[0]) / 1000.0, bpm
+
     def insert_heart_rate(
         self,
         activity_id: int,
@@ -336,19 +668,12 @@ class DatabaseManager:
         rr: float | None,
         energy: float | None,
     ) -> None:
-        # collect into pending list
-        hr = HeartRate(
-            activity_id=activity_id,
-            timestamp_ms=timestamp_ms,
-            bpm=bpm,
-            rr_interval=rr,
-            energy_kj=energy,
-        )
-        self._pending_hr.append(hr)
-
-        # flush in batches
-        if len(self._pending_hr) >= self.BATCH_SIZE:
-            self._flush_pending()
+        # written straight into the column buffer, no per-sample row object
+        with self._pending_lock:
+            self._pending_hr.append(activity_id, timestamp_ms, bpm, rr, energy)
+            due = self._flush_due(self._pending_hr)
+        if due:
+            self._request_flush()
 
     def insert_running_metrics(
         self,
@@ -356,21 +681,23 @@ class DatabaseManager:
         sample: RunningSample | TrainerSample,
         incline_percent: float | None,
     ) -> None:
-        rm = RunningMetrics(
-            activity_id=activity_id,
-            timestamp_ms=sample.timestamp_ms,
-            speed_mps=sample.speed_mps,
-            cadence_spm=sample.cadence_spm,
-            stride_length_m=sample.stride_length_m if isinstance(sample, RunningSample) else None,
-            total_distance_m=sample.distance_m,
-            power_watts=sample.power_watts,
-            incline_percent=incline_percent,
-            altitude_m=sample.altitude_m
-            or (sample.inclination if isinstance(sample, TrainerSample) else None),
+        self._stage(
+            self._pending_run,
+            {
+                "activity_id": activity_id,
+                "timestamp_ms": sample.timestamp_ms,
+                "speed_mps": sample.speed_mps,
+                "cadence_spm": sample.cadence_spm,
+                "stride_length_m": (
+                    sample.stride_length_m if isinstance(sample, RunningSample) else None
+                ),
+                "total_distance_m": sample.distance_m,
+                "power_watts": sample.power_watts,
+                "incline_percent": incline_percent,
+                "altitude_m": sample.altitude_m
+                or (sample.inclination if isinstance(sample, TrainerSample) else None),
+            },
         )
-        self._pending_run.append(rm)
-        if len(self._pending_run) >= self.BATCH_SIZE:
-            self._flush_pending()
 
     def insert_cycling_metrics(
         self,
@@ -378,34 +705,116 @@ class DatabaseManager:
         sample: CyclingSample | TrainerSample,
         incline_percent: float | None,
     ) -> None:
-        cm = CyclingMetrics(
-            activity_id=activity_id,
-            timestamp_ms=sample.timestamp_ms,
-            speed_mps=sample.speed_mps,
-            cadence_rpm=sample.cadence_rpm,
-            total_distance_m=sample.distance_m,
-            power_watts=sample.power_watts,
-            incline_percent=incline_percent,
-            altitude_m=sample.altitude_m
-            or (sample.inclination if isinstance(sample, TrainerSample) else None),
+        self._stage(
+            self._pending_cyc,
+            {
+                "activity_id": activity_id,
+                "timestamp_ms": sample.timestamp_ms,
+                "speed_mps": sample.speed_mps,
+                "cadence_rpm": sample.cadence_rpm,
+                "total_distance_m": sample.distance_m,
+                "power_watts": sample.power_watts,
+                "incline_percent": incline_percent,
+                "altitude_m": sample.altitude_m
+                or (sample.inclination if isinstance(sample, TrainerSample) else None),
+            },
         )
-        self._pending_cyc.append(cm)
-        if len(self._pending_cyc) >= self.BATCH_SIZE:
+
+    def close(self) -> None:
+        """Stop the writer, write out any staged samples and release pooled connections."""
+        if self._writer is not None:
+            self._writer_stop.set()
+            self._writer_wakeup.set()
+            self._writer.join()
+            self._writer = None
+        self._flush_pending()
+        self.engine.dispose()
+        for remote_engine in self._remote_engines.values():
+            remote_engine.dispose()
+        self._remote_engines.clear()
+        self._remote_schema_ready.clear()
+
+    def _stage(self, pending: list[dict], row: dict) -> None:
+        """Queue *row* and flush once a batch fills or the flush interval has elapsed."""
+        with self._pending_lock:
+            pending.append(row)
+            due = self._flush_due(pending)
+        if due:
+            self._request_flush()
+
+    def _request_flush(self) -> None:
+        if self._writer is None:
             self._flush_pending()
+        else:
+            self._writer_wakeup.set()
+
+    def _writer_loop(self) -> None:
+        while not self._writer_stop.is_set():
+            self._writer_wakeup.wait(timeout=self.FLUSH_INTERVAL_S)
+            self._writer_wakeup.clear()
+            # anything may go wrong here, but the thread must survive it; the
+            # failed batch is already re-staged for the next flush
+            try:
+                self._flush_pending()
+            except Exception as e:
+                logger.error(f"Failed to write staged samples, will retry: {e}")
+
+    def _flush_due(self, pending: list[dict] | _HeartRateBuffer) -> bool:
+        return (
+            len(pending) >= self.BATCH_SIZE
+            or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_S
+        )
 
     def _flush_pending(self):
-        with self.Session() as session:
-            if self._pending_hr:
-                session.add_all(self._pending_hr)
-            if self._pending_run:
-                session.add_all(self._pending_run)
-            if self._pending_cyc:
-                session.add_all(self._pending_cyc)
-            session.commit()
-
-        self._pending_hr.clear()
-        self._pending_run.clear()
-        self._pending_cyc.clear()
+        # serialised with other flushes so callers see every earlier sample
+        with self._write_lock:
+            hrs, runs, cycs = self._take_pending()
+            if not (hrs or runs or cycs):
+                return
+
+            # one transaction for every staged row
+            try:
+                with self.Session.begin() as session:
+                    self._write_pending(session, hrs, runs, cycs)
+            except Exception:
+                # nothing was committed, so the next flush retries the whole batch
+                self._restore_pending(hrs, runs, cycs)
+                raise
+
+    def _take_pending(self) -> tuple[list[dict], list[dict], list[dict]]:
+        """Hand over the staged rows, leaving the staging lists empty."""
+        # Taken under the lock but written outside of it, so the recorder
+        # thread never waits on a commit made by e.g. a sync.
+        with self._pending_lock:
+            self._last_flush = time.monotonic()
+            pending = (self._pending_hr.drain(), self._pending_run[:], self._pending_cyc[:])
+            self._pending_run.clear()
+            self._pending_cyc.clear()
+        return pending
+
+    def _restore_pending(self, hrs: list[dict], runs: list[dict], cycs: list[dict]) -> None:
+        """Re-stage rows from a failed write ahead of those staged in the meantime."""
+        with self._pending_lock:
+            self._pending_hr.restore(hrs)
+            self._pending_run[:0] = runs
+            self._pending_cyc[:0] = cycs
+
+    @staticmethod
+    def _write_pending(
+        session: Session,
+        hrs: list[dict],
+        runs: list[dict],
+        cycs: list[dict],
+    ) -> None:
+        conn = session.connection()
+        for stmt, rows in ((_HR_INSERT, hrs), (_RUN_INSERT, runs), (_CYC_INSERT, cycs)):
+            if not rows:
+                continue
+            if conn.dialect.name == "sqlite":
+                _sqlite_insert_rows(conn, stmt.table.name, rows)
+            else:
+                # Core executemany inserts against the tables (no ORM bulk-save bookkeeping)
+                session.execute(stmt, rows)
 
     def _migrate(self, engine) -> None:
         """Add any missing columns to existing tables using schema inspection."""
@@ -425,16 +834,26 @@ class DatabaseManager:
     def sync_to_database(self, database_dsn: str):
         self._flush_pending()
 
+        # engines are kept per DSN so repeated syncs reuse pooled connections
+        remote_engine = self._remote_engines.get(database_dsn)
         try:
-            remote_engine = create_engine(database_dsn, echo=False)
+            if remote_engine is None:
+                remote_engine = create_engine(
+                    database_dsn,
+                    echo=False,
+                    pool_pre_ping=True,
+                    **_remote_engine_kwargs(database_dsn),
+                )
+                self._remote_engines[database_dsn] = remote_engine
             with remote_engine.connect() as _:
                 pass
         except exc.SQLAlchemyError as e:
             msg = f"❌  Could not connect to remote database: {e}"
             raise ConnectionError(msg)
 
-        remote_engine = create_engine(database_dsn, echo=False)
-        Base.metadata.create_all(remote_engine)
+        if database_dsn not in self._remote_schema_ready:
+            Base.metadata.create_all(remote_engine)
+            self._remote_schema_ready.add(database_dsn)
         LocalSession = self.Session
         RemoteSession = sessionmaker(bind=remote_engine)
 
@@ -442,200 +861,67 @@ class DatabaseManager:
 
         with LocalSession() as local, RemoteSession() as remote:
             # ---------- Local → Remote ----------
-            def _sync_batch_l2r(batch: list[Activity]):
-                existing = {t for (t,) in remote.query(Activity.start_time).all()}
-                existing = {t.astimezone(ZoneInfo("UTC")) for t in existing}
-                new_batch = [
-                    act
-                    for act in batch
-                    if act.start_time.replace(tzinfo=ZoneInfo("UTC")) not in existing
-                ]
-                for act in new_batch:
-                    if act.start_time in existing:
-                        continue
-                    new_act = Activity(start_time=act.start_time, end_time=act.end_time)
-                    remote.add(new_act)
-                    remote.flush()
-
-                    # HR rows
-                    hrs = (
-                        local.query(HeartRate)
-                        .filter_by(activity_id=act.id)
-                        .order_by(HeartRate.timestamp_ms)
-                        .all()
-                    )
-                    if hrs:
-                        remote.bulk_insert_mappings(
-                            HeartRate,
-                            [
-                                {
-                                    "activity_id": new_act.id,
-                                    "timestamp_ms": hr.timestamp_ms,
-                                    "bpm": hr.bpm,
-                                    "rr_interval": hr.rr_interval,
-                                    "energy_kj": hr.energy_kj,
-                                }
-                                for hr in hrs
-                            ],
-                        )
-
-                    # Running rows
-                    runs = (
-                        local.query(RunningMetrics)
-                        .filter_by(activity_id=act.id)
-                        .order_by(RunningMetrics.timestamp_ms)
-                        .all()
-                    )
-                    if runs:
-                        remote.bulk_insert_mappings(
-                            RunningMetrics,
-                            [
-                                {
-                                    "activity_id": new_act.id,
-                                    "timestamp_ms": r.timestamp_ms,
-                                    "speed_mps": r.speed_mps,
-                                    "cadence_spm": r.cadence_spm,
-                                    "stride_length_m": r.stride_length_m,
-                                    "total_distance_m": r.total_distance_m,
-                                    "power_watts": r.power_watts,
-                                    "incline_percent": r.incline_percent,
-                                    "altitude_m": r.altitude_m,
-                                }
-                                for r in runs
-                            ],
-                        )
-
-                    # Cycling rows
-                    cycls = (
-                        local.query(CyclingMetrics)
-                        .filter_by(activity_id=act.id)
-                        .order_by(CyclingMetrics.timestamp_ms)
-                        .all()
-                    )
-                    if cycls:
-                        remote.bulk_insert_mappings(
-                            CyclingMetrics,
-                            [
-                                {
-                                    "activity_id": new_act.id,
-                                    "timestamp_ms": c.timestamp_ms,
-                                    "speed_mps": c.speed_mps,
-                                    "cadence_rpm": c.cadence_rpm,
-                                    "total_distance_m": c.total_distance_m,
-                                    "power_watts": c.power_watts,
-                                    "incline_percent": c.incline_percent,
-                                    "altitude_m": c.altitude_m,
-                                }
-                                for c in cycls
-                            ],
-                        )
-
-            batch = []
-            for act in (
-                local.query(Activity).order_by(Activity.start_time).yield_per(SYNC_BATCH_SIZE)
-            ):
-                batch.append(act)
-                if len(batch) >= SYNC_BATCH_SIZE:
-                    _sync_batch_l2r(batch)
-                    batch.clear()
-            if batch:
+            # built once and kept current as activities are copied over
+            remote_existing = {
+                t.astimezone(UTC) for (t,) in remote.query(Activity.start_time).all()
+            }
+
+            def _sync_batch_l2r(batch: list[Row]):
+                new_acts = []
+                for act in batch:
+                    start_utc = act.start_time.replace(tzinfo=UTC)
+                    if start_utc not in remote_existing:
+                        remote_existing.add(start_utc)
+                        new_acts.append(act)
+                if not new_acts:
+                    return
+
+                new_ids = _insert_activities(remote, new_acts)
+                id_map = dict(zip((a.id for a in new_acts), new_ids, strict=True))
+                _copy_samples(local, remote, id_map)
+
+            # Keyset pages instead of one long cursor: ending the local read
+            # transaction after every page lets WAL checkpoints keep up with the
+            # recorder while a large sync is running.
+            last_id = 0
+            while batch := local.execute(
+                select(Activity.id, Activity.start_time, Activity.end_time)
+                .where(Activity.id > last_id)
+                .order_by(Activity.id)
+                .limit(SYNC_BATCH_SIZE),
+            ).all():
                 _sync_batch_l2r(batch)
+                last_id = batch[-1].id
+                local.rollback()
             remote.commit()
 
             # ---------- Remote → Local ----------
-            def _sync_batch_r2l(batch: list[Activity]):
-                existing = {t for (t,) in local.query(Activity.start_time).all()}
-                existing = {t.replace(tzinfo=ZoneInfo("UTC")) for t in existing}
-                new_batch = [
-                    act
-                    for act in batch
-                    if act.start_time.astimezone(ZoneInfo("UTC")) not in existing
-                ]
-                for act in new_batch:
-                    if act.start_time in existing:
-                        continue
-                    new_act = Activity(start_time=act.start_time, end_time=act.end_time)
-                    local.add(new_act)
-                    local.flush()
-
-                    hrs = (
-                        remote.query(HeartRate)
-                        .filter_by(activity_id=act.id)
-                        .order_by(HeartRate.timestamp_ms)
-                        .all()
-                    )
-                    if hrs:
-                        local.bulk_insert_mappings(
-                            HeartRate,
-                            [
-                                {
-                                    "activity_id": new_act.id,
-                                    "timestamp_ms": hr.timestamp_ms,
-                                    "bpm": hr.bpm,
-                                    "rr_interval": hr.rr_interval,
-                                    "energy_kj": hr.energy_kj,
-                                }
-                                for hr in hrs
-                            ],
-                        )
-
-                    runs = (
-                        remote.query(RunningMetrics)
-                        .filter_by(activity_id=act.id)
-                        .order_by(RunningMetrics.timestamp_ms)
-                        .all()
-                    )
-                    if runs:
-                        local.bulk_insert_mappings(
-                            RunningMetrics,
-                            [
-                                {
-                                    "activity_id": new_act.id,
-                                    "timestamp_ms": r.timestamp_ms,
-                                    "speed_mps": r.speed_mps,
-                                    "cadence_spm": r.cadence_spm,
-                                    "stride_length_m": r.stride_length_m,
-                                    "total_distance_m": r.total_distance_m,
-                                    "power_watts": r.power_watts,
-                                    "incline_percent": r.incline_percent,
-                                    "altitude_m": r.altitude_m,
-                                }
-                                for r in runs
-                            ],
-                        )
-
-                    cycls = (
-                        remote.query(CyclingMetrics)
-                        .filter_by(activity_id=act.id)
-                        .order_by(CyclingMetrics.timestamp_ms)
-                        .all()
-                    )
-                    if cycls:
-                        local.bulk_insert_mappings(
-                            CyclingMetrics,
-                            [
-                                {
-                                    "activity_id": new_act.id,
-                                    "timestamp_ms": c.timestamp_ms,
-                                    "speed_mps": c.speed_mps,
-                                    "cadence_rpm": c.cadence_rpm,
-                                    "total_distance_m": c.total_distance_m,
-                                    "power_watts": c.power_watts,
-                                    "incline_percent": c.incline_percent,
-                                    "altitude_m": c.altitude_m,
-                                }
-                                for c in cycls
-                            ],
-                        )
-
-            batch = []
-            for act in (
-                remote.query(Activity).order_by(Activity.start_time).yield_per(SYNC_BATCH_SIZE)
-            ):
-                batch.append(act)
-                if len(batch) >= SYNC_BATCH_SIZE:
-                    _sync_batch_r2l(batch)
-                    batch.clear()
-            if batch:
+            local_existing = {
+                t.replace(tzinfo=UTC) for (t,) in local.query(Activity.start_time).all()
+            }
+
+            def _sync_batch_r2l(batch: list[Row]):
+                new_acts = []
+                for act in batch:
+                    start_utc = act.start_time.astimezone(UTC)
+                    if start_utc not in local_existing:
+                        local_existing.add(start_utc)
+                        new_acts.append(act)
+                if not new_acts:
+                    return
+
+                new_ids = _insert_activities(local, new_acts)
+                id_map = dict(zip((a.id for a in new_acts), new_ids, strict=True))
+                _copy_samples(remote, local, id_map)
+
+            activities = remote.execute(
+                select(Activity.id, Activity.start_time, Activity.end_time)
+                .order_by(Activity.start_time)
+                .execution_options(stream_results=True, yield_per=SYNC_BATCH_SIZE),
+            )
+            # Commit each partition on its own so the local write lock is only
+            # held for one batch, not the whole pull; the recorder's writer
+            # thread can flush in between instead of hitting "database is locked".
+            for batch in activities.partitions():
                 _sync_batch_r2l(batch)
-            local.commit()
+                local.commit()
@@ -3,7 +3,6 @@ import contextlib
 import threading
 from collections import deque
 from collections.abc import Callable
-from statistics import median
 from typing import TYPE_CHECKING, Literal
 
 import gi
@@ -32,11 +31,15 @@ if TYPE_CHECKING:
     from concurrent.futures import Future
 
     from bleak.backends.device import BLEDevice
+    from bleak.backends.scanner import AdvertisementData
 
 type TrainerTargetMode = Literal["Power", "Resistance", "Speed", "HeartRate"]
 
 
 class Recorder:
+    # Queued samples reach the UI at most this often (~30 Hz)
+    UI_DRAIN_INTERVAL_MS = 33
+
     def __init__(
         self,
         weight_kg: float | None,
@@ -125,6 +128,14 @@ class Recorder:
         # Rolling 3 bpm for smoothinng out hr readings
         self._bpm_history: deque[int] = deque(maxlen=3)
 
+        # Latest cleaned sample per sample type, waiting for the GTK thread; a single
+        # timer callback drains them
+        self._ui_lock = threading.Lock()
+        self._ui_latest: dict[
+            type, CyclingSample | HeartRateSample | RunningSample | TrainerSample
+        ] = {}
+        self._ui_drain_scheduled = False
+
         # Connection status
         self.hr_connected = False
         self.speed_connected = False
@@ -176,6 +187,7 @@ class Recorder:
             # otherwise-unused loop belongs to this thread and can close here.
             if not self.loop.is_closed():
                 self.loop.close()
+            self.db.close()
             return True
 
         if self._thread:
@@ -184,6 +196,7 @@ class Recorder:
                 logger.error(f"Recorder worker did not stop within {timeout:.1f}s")
                 return False
 
+        self.db.close()
         return True
 
     def start_recording(self):
@@ -240,6 +253,35 @@ class Recorder:
             except TimeoutError:
                 pass
 
+    # --- UI handoff ---
+    def _post_sample(
+        self,
+        sample: CyclingSample | HeartRateSample | RunningSample | TrainerSample,
+    ) -> None:
+        """Hand a cleaned sample to the UI, scheduling a drain only if none is pending.
+
+        The UI only shows the newest reading of each kind (distance and energy are
+        cumulative), so a sample replaces any undelivered one of the same type and
+        the handoff never grows. The drain runs on a short timer rather than an
+        idle callback so bursts of sensor notifications share one dispatch.
+        """
+        with self._ui_lock:
+            self._ui_latest[type(sample)] = sample
+            if self._ui_drain_scheduled:
+                return
+            self._ui_drain_scheduled = True
+        GLib.timeout_add(self.UI_DRAIN_INTERVAL_MS, self._drain_ui_samples)
+
+    def _drain_ui_samples(self) -> bool:
+        """Deliver the latest sample of each type to the UI callback."""
+        with self._ui_lock:
+            samples, self._ui_latest = self._ui_latest, {}
+            self._ui_drain_scheduled = False
+        if self.on_sample:
+            for sample in samples.values():
+                self.on_sample(sample)
+        return False
+
     # --- HR handling ---
     def _handle_hr_sample(self, sample: HeartRateSample) -> None:
         """Handle a HeartRateSample from HeartRateMux."""
@@ -247,23 +289,37 @@ class Recorder:
             return
 
         logger.bind(data=sample).trace("Handling heart rate sample")
+        self._record_bpm(
+            sample.timestamp_ms,
+            sample.heart_rate_bpm,
+            sample.rr_interval_ms,
+            sample.energy_expended_kcal,
+        )
 
+    def _record_bpm(
+        self,
+        timestamp_ms: int,
+        bpm: int,
+        rr_interval_ms: float | None,
+        energy_kcal: float | None,
+    ) -> None:
+        """Smooth, publish and persist one heart rate reading given as plain values."""
         # Initialize the session start
         if self._start_ms is None:
-            self._start_ms = sample.timestamp_ms
+            self._start_ms = timestamp_ms
 
-        delta_ms = int(sample.timestamp_ms - self._start_ms)
+        delta_ms = int(timestamp_ms - self._start_ms)
 
         # Smooth out the bpm using a rolling median
-        self._bpm_history.append(sample.heart_rate_bpm)
-        smoothed_bpm = int(median(self._bpm_history))
+        self._bpm_history.append(bpm)
+        smoothed_bpm = self._median_bpm()
 
         # Cleaned sample for UI
         cleaned_sample = HeartRateSample(
             timestamp_ms=delta_ms,
             heart_rate_bpm=smoothed_bpm,
         )
-        GLib.idle_add(self.on_sample, cleaned_sample)
+        self._post_sample(cleaned_sample)
 
         logger.bind(data=cleaned_sample).trace("Processed heart rate sample")
 
@@ -273,10 +329,19 @@ class Recorder:
                 self.activity_id,
                 delta_ms,
                 smoothed_bpm,
-                sample.rr_interval_ms,
-                sample.energy_expended_kcal,
+                rr_interval_ms,
+                energy_kcal,
             )
 
+    def _median_bpm(self) -> int:
+        """Median of the (at most three) recent bpm readings, without sorting."""
+        history = self._bpm_history
+        if len(history) == history.maxlen:
+            a, b, c = history
+            return a + b + c - min(a, b, c) - max(a, b, c)
+        # warm-up: the mean of the first two readings, or the only one
+        return (history[0] + history[-1]) // 2
+
     # --- Running handling ---
     def _handle_running_sample(self, sample: RunningSample):
         if not self.on_sample:
@@ -339,7 +404,7 @@ class Recorder:
             },
         )
 
-        GLib.idle_add(self.on_sample, cleaned_sample)
+        self._post_sample(cleaned_sample)
 
         logger.bind(data=cleaned_sample).trace("Processed running sample")
 
@@ -381,7 +446,7 @@ class Recorder:
             },
         )
 
-        GLib.idle_add(self.on_sample, cleaned_sample)
+        self._post_sample(cleaned_sample)
 
         logger.bind(data=cleaned_sample).trace("Processed cycling sample")
 
@@ -434,15 +499,10 @@ class Recorder:
         if self.trainer_supplied_hr and sample.heart_rate_bpm is not None:
             self._trainer_heart_rate_available = True
             self.hr_connected = True
-            self._handle_hr_sample(
-                HeartRateSample(
-                    timestamp_ms=sample.timestamp_ms,
-                    heart_rate_bpm=sample.heart_rate_bpm,
-                ),
-            )
+            self._record_bpm(sample.timestamp_ms, sample.heart_rate_bpm, None, None)
 
         # Update UI
-        GLib.idle_add(self.on_sample, cleaned_sample)
+        self._post_sample(cleaned_sample)
 
         logger.bind(data=cleaned_sample).trace("Processed trainer sample")
 
@@ -471,9 +531,7 @@ class Recorder:
             self._stop_event.set()
 
         # Scan for BLE devices upfront, call bleaksport with found devices to speed up connection
-        self.devices = await BleakScanner.discover(
-            timeout=5.0,
-        )
+        self.devices = await self._discover_devices(wait_s=5.0)
 
         logger.debug(f"BLE scan complete, found {len(self.devices)} devices")
         logger.bind(data=self.devices).trace("Discovered BLE devices")
@@ -603,6 +661,50 @@ class Recorder:
 
         logger.debug("Workflow exiting")
 
+    async def _discover_devices(self, *, wait_s: float) -> "list[BLEDevice]":
+        """Scan until every configured sensor has been seen, or *wait_s* elapses.
+
+        Sensors are usually advertising already, so this returns well before the
+        full timeout instead of always paying for a fixed-length discovery.
+        """
+        remaining = [
+            (address, name)
+            for address, name in (
+                (self.hr_address, self.hr_name),
+                (self.speed_address, self.speed_name),
+                (self.cadence_address, self.cadence_name),
+                (self.power_address, self.power_name),
+                (self.trainer_address, self.trainer_name),
+            )
+            if address or name
+        ]
+        # Set lookups so the common case, an unrelated advertisement, costs two
+        # hash probes instead of a walk over the configured sensors
+        wanted_addresses = {address for address, _ in remaining if address}
+        wanted_names = {name for _, name in remaining if name}
+        found: dict[str, BLEDevice] = {}
+        all_seen = asyncio.Event()
+        if not remaining:
+            all_seen.set()
+
+        def on_detect(device: "BLEDevice", _adv: "AdvertisementData") -> None:
+            found[device.address] = device
+            if device.address not in wanted_addresses and device.name not in wanted_names:
+                return
+            remaining[:] = [
+                (address, name)
+                for address, name in remaining
+                if not ((address and device.address == address) or (name and device.name == name))
+            ]
+            if not remaining:
+                all_seen.set()
+
+        async with BleakScanner(detection_callback=on_detect):
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(all_seen.wait(), timeout=wait_s)
+
+        return list(found.values())
+
     async def _speed_loop(self) -> None:
         if self.sport_type == SportTypesEnum.running:
             mux = RunningMux(
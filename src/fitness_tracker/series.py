@@ -0,0 +1,113 @@
+import numpy as np
+
+
+def rolling(
+    ys: np.ndarray | list[float | None],
+    window: int,
+    *,
+    use_median: bool = False,
+) -> np.ndarray:
+    """Rolling mean/median over `window` samples, ignoring None/NaN values.
+
+    Returns an array the same length as `ys`. Bins with no valid samples stay NaN.
+    """
+    arr = np.asarray(ys, dtype=float)
+    if window <= 1 or arr.size == 0:
+        return arr
+    n = arr.size
+    half = window // 2
+    idx = np.arange(n)
+    lo = np.maximum(idx - half, 0)
+    hi = np.minimum(idx + half + 1, n)
+    valid = ~np.isnan(arr)
+
+    if use_median:
+        out = np.full(n, np.nan)
+        for i in range(n):
+            seg = arr[lo[i] : hi[i]][valid[lo[i] : hi[i]]]
+            if seg.size:
+                out[i] = np.median(seg)
+        return out
+
+    # Windowed sums and counts from prefix sums, one pass instead of a slice per sample
+    sums = np.concatenate(([0.0], np.cumsum(np.where(valid, arr, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(valid)))
+    win_counts = counts[hi] - counts[lo]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(win_counts > 0, (sums[hi] - sums[lo]) / win_counts, np.nan)
+
+
+def decimate(
+    xs: np.ndarray,
+    ys: np.ndarray | list[float | None],
+    target: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Stride-decimate a series to about `target` points, keeping the last sample.
+
+    Plotting more points than the chart has pixels only costs draw time.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    n = len(xs)
+    if n <= target:
+        return xs, ys
+    idx = np.arange(0, n, -(-n // target))
+    if idx[-1] != n - 1:
+        idx = np.append(idx, n - 1)
+    return xs[idx], ys[idx]
+
+
+class SampleWindow:
+    """Columnar (time_ms, bpm, watts) buffer backing the live chart.
+
+    Samples are written into preallocated NumPy columns and the time window is
+    trimmed by advancing a start index, so the chart gets contiguous views
+    with no per-sample allocation. When the write position reaches the end,
+    the live samples are moved back to the front, or the buffer doubles if
+    the window itself has outgrown it.
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        self._data = np.empty((3, capacity), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def times(self) -> np.ndarray:
+        """Sample times in ms, oldest first."""
+        return self._data[0, self._start : self._end]
+
+    @property
+    def bpms(self) -> np.ndarray:
+        """Heart rate for each sample."""
+        return self._data[1, self._start : self._end]
+
+    @property
+    def powers(self) -> np.ndarray:
+        """Power in watts for each sample."""
+        return self._data[2, self._start : self._end]
+
+    def append(self, t_ms: float, bpm: float, watts: float) -> None:
+        """Add one sample at the end of the window."""
+        capacity = self._data.shape[1]
+        if self._end == capacity:
+            n = len(self)
+            live = self._data[:, self._start : self._end]
+            if 2 * n > capacity:
+                self._data = np.empty((3, 2 * capacity), dtype=np.float64)
+            self._data[:, :n] = live
+            self._start, self._end = 0, n
+        self._data[:, self._end] = (t_ms, bpm, watts)
+        self._end += 1
+
+    def trim_before(self, cutoff_ms: float) -> None:
+        """Drop leading samples older than *cutoff_ms*."""
+        fresh = self.times >= cutoff_ms
+        self._start += int(fresh.argmax()) if fresh.any() else len(fresh)
+
+    def clear(self) -> None:
+        """Drop every sample, keeping the allocated columns."""
+        self._start = self._end = 0
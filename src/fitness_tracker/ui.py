@@ -2,7 +2,6 @@ import contextlib
 import socket
 import threading
 from collections.abc import Callable
-from configparser import ConfigParser
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -86,8 +85,8 @@ class FitnessAppUI(Adw.Application):
         self.window = None
         self.recorder: Recorder | None = None
         self._sensor_apply_lock = threading.Lock()
-        self._times: list[float] = []
-        self._bpms: list[int] = []
+        # ((resting_hr, max_hr), zones) from the last calculate_hr_zones call
+        self._hr_zones_cache: tuple[tuple[int, int], dict[str, tuple[float, float]]] | None = None
 
         self.history_filter = "week"
 
@@ -508,8 +507,17 @@ class FitnessAppUI(Adw.Application):
         self.window.add_breakpoint(bp)
 
     def calculate_hr_zones(self):
-        """Returns a mapping of zone names to (lower_bpm, upper_bpm) using Karvonen formula."""
-        hr_range = self.app_settings.personal.max_hr - self.app_settings.personal.resting_hr
+        """Returns a mapping of zone names to (lower_bpm, upper_bpm) using Karvonen formula.
+
+        The result is cached until resting or max HR changes; treat it as read-only.
+        """
+        resting_hr = self.app_settings.personal.resting_hr
+        max_hr = self.app_settings.personal.max_hr
+        key = (resting_hr, max_hr)
+        if self._hr_zones_cache is not None and self._hr_zones_cache[0] == key:
+            return self._hr_zones_cache[1]
+
+        hr_range = max_hr - resting_hr
         intensities = [
             ("Zone 1", 0.50, 0.60),
             ("Zone 2", 0.60, 0.70),
@@ -519,9 +527,10 @@ class FitnessAppUI(Adw.Application):
         ]
         thresholds = {}
         for name, low_pct, high_pct in intensities:
-            low = self.app_settings.personal.resting_hr + hr_range * low_pct
-            high = self.app_settings.personal.resting_hr + hr_range * high_pct
+            low = resting_hr + hr_range * low_pct
+            high = resting_hr + hr_range * high_pct
             thresholds[name] = (low, high)
+        self._hr_zones_cache = (key, thresholds)
         return thresholds
 
     def draw_zones(self, ax):
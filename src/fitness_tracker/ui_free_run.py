@@ -3,8 +3,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import gi
-from matplotlib.backends.backend_gtk4agg import FigureCanvasGTK4Agg as FigureCanvas
-from matplotlib.figure import Figure
 
 from fitness_tracker.database import SportTypesEnum
 from fitness_tracker.ui_mode import IndoorOutdoorEnum
@@ -179,7 +177,12 @@ class FreeRunView(Gtk.Box):
 
         self.append(grid)
 
-        # Chart
+        # Chart; Matplotlib is only loaded once a free-run view is opened
+        from matplotlib.backends.backend_gtk4cairo import (  # noqa: PLC0415
+            FigureCanvasGTK4Cairo as FigureCanvas,
+        )
+        from matplotlib.figure import Figure  # noqa: PLC0415
+
         self.fig = Figure(figsize=(6, 3), dpi=96)
         self.ax_hr = self.fig.add_subplot(111)
         self._style_hr_axis()
@@ -190,10 +193,15 @@ class FreeRunView(Gtk.Box):
         (self.line_pw,) = self.ax_pw.plot([], [], lw=2, linestyle="--", color="#00FFFF", zorder=1)
         (self.line_hr,) = self.ax_hr.plot([], [], lw=2, zorder=2)
 
-        canvas = FigureCanvas(self.fig)
-        canvas.set_vexpand(True)
+        # last applied power limits / HR colour, so unchanged values aren't re-set
+        self._pw_ylim: tuple[float, float] = self.ax_pw.get_ylim()
+        self._hr_rgb = None
+
+        self.canvas = FigureCanvas(self.fig)
+        self.canvas.set_vexpand(True)
+        self.canvas.connect("map", lambda *_: self.canvas.draw_idle())
         frame = Gtk.Frame(label="Live HR / Power")
-        frame.set_child(canvas)
+        frame.set_child(self.canvas)
         self.append(frame)
 
         # initial values
@@ -270,16 +278,26 @@ class FreeRunView(Gtk.Box):
     ) -> None:
         self.line_hr.set_data(x_secs, hr)
         self.line_pw.set_data(x_secs, pw)
-        self.line_hr.set_color(hr_rgb)
+        if hr_rgb != self._hr_rgb:
+            self._hr_rgb = hr_rgb
+            self.line_hr.set_color(hr_rgb)
 
         if len(pw) >= 2:
             pmin, pmax = float(pw.min()), float(pw.max())
             pad = max(10.0, 0.1 * (pmax - pmin if pmax != pmin else max(1.0, pmax)))
-            self.ax_pw.set_ylim(max(0.0, pmin - pad), pmax + pad)
+            ylim = (max(0.0, pmin - pad), pmax + pad)
         else:
-            self.ax_pw.set_ylim(0, 500)
-
-        self.fig.canvas.draw_idle()
+            ylim = (0.0, 500.0)
+        # set_ylim invalidates the tick layout, so only touch it on a change
+        if ylim != self._pw_ylim:
+            self._pw_ylim = ylim
+            self.ax_pw.set_ylim(*ylim)
+
+        # A hidden chart is redrawn on its "map" signal, so skip the render until then.
+        # GTK canvases can't blit, so a visible update is a full draw_idle(); the
+        # tracker already limits how often this runs (chart_interval_s).
+        if self.canvas.get_mapped():
+            self.canvas.draw_idle()
 
     def _on_incline_change(self, percent: float) -> None:
         """Propagated up to the app via on_incline if set."""
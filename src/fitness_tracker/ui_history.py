@@ -1,17 +1,16 @@
 import datetime
-import math
 import statistics
 import threading
+from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
-from zoneinfo import ZoneInfo
+from typing import TYPE_CHECKING
 
 import gi
 import numpy as np
 from loguru import logger
-from matplotlib.backends.backend_gtk4agg import FigureCanvasGTK4Agg as FigureCanvas
-from matplotlib.figure import Figure
-from matplotlib.ticker import FuncFormatter
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from fitness_tracker.activity_stats import ActivityStats
 from fitness_tracker.database import (
@@ -22,9 +21,18 @@ from fitness_tracker.database import (
     SportTypesEnum,
 )
 from fitness_tracker.exporters import activity_to_tcx, infer_sport
+from fitness_tracker.series import decimate, rolling
 
 gi.require_versions({"Gtk": "4.0", "Adw": "1"})
-from gi.repository import Adw, Gio, GLib, Gtk  # noqa: E402  # ty:ignore[unresolved-import]
+from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gtk  # noqa: E402  # ty:ignore[unresolved-import]
+
+if TYPE_CHECKING:
+    import cairo
+
+SPARKLINE_WIDTH_PX = 260
+SPARKLINE_HEIGHT_PX = 44
+# Full-resolution HR series kept for sparklines and the compare chart
+HR_SERIES_CACHE_SIZE = 32
 
 
 def _format_hms(seconds: int) -> str:
@@ -33,26 +41,30 @@ def _format_hms(seconds: int) -> str:
     return f"{h:d}:{m:02d}:{s:02d}" if h else f"{m:d}:{s:02d}"
 
 
-def _rolling(ys: list[float | None], window: int, use_median: bool = False) -> list[float | None]:
-    """Rolling mean/median over `window` samples, ignoring None values.
-
-    Returns a list the same length as `ys`. Bins with no valid samples stay None.
-    """
-    if window <= 1 or not ys:
-        return ys
-    arr = np.array([np.nan if v is None else float(v) for v in ys], dtype=float)
-    n = len(arr)
-    half = window // 2
-    out: list[float | None] = [None] * n
-    for i in range(n):
-        lo = max(0, i - half)
-        hi = min(n, i + half + 1)
-        seg = arr[lo:hi]
-        seg = seg[~np.isnan(seg)]
-        if seg.size == 0:
-            continue
-        out[i] = float(np.median(seg) if use_median else np.mean(seg))
-    return out
+def _draw_sparkline(
+    _area: Gtk.DrawingArea,
+    cr: "cairo.Context",
+    width: int,
+    height: int,
+    data: tuple[np.ndarray, np.ndarray, Gdk.RGBA],
+) -> None:
+    """Gtk.DrawingArea draw func: scaled HR polyline over the theme background."""
+    xs, ys, bg = data
+    cr.set_source_rgba(bg.red, bg.green, bg.blue, bg.alpha)
+    cr.paint()
+
+    # Same 5% padding Matplotlib's autoscaling leaves around the data
+    x_span = (xs[-1] - xs[0]) or 1.0
+    y_span = (np.nanmax(ys) - np.nanmin(ys)) or 1.0
+    px = width * 0.05 + (xs - xs[0]) * (width * 0.9 / x_span)
+    py = height * 0.95 - (ys - np.nanmin(ys)) * (height * 0.9 / y_span)
+
+    cr.move_to(px[0], py[0])
+    for x, y in zip(px[1:], py[1:], strict=True):
+        cr.line_to(x, y)
+    cr.set_source_rgb(0.122, 0.467, 0.706)  # Matplotlib's default "C0" blue
+    cr.set_line_width(1.2 * 96 / 72)  # 1.2 pt at 96 dpi
+    cr.stroke()
 
 
 def _format_pace_from_mps(mps: float) -> str:
@@ -68,11 +80,11 @@ def _format_pace_from_mps(mps: float) -> str:
     return f"{mm}:{ss:02d} min/mi"
 
 
-def _pace_min_per_mile_from_mps(mps: float) -> float:
-    if mps <= 0.01:
-        return float("inf")
+def _pace_min_per_mile_from_mps(mps: np.ndarray) -> np.ndarray:
+    """Element-wise pace in min/mi; NaN where the speed is missing or ~0."""
     mph = mps * 2.23693629
-    return 60.0 / mph
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(mps > 0.01, 60.0 / mph, np.nan)
 
 
 def _format_distance_m(distance_m: float | None) -> str:
@@ -91,7 +103,7 @@ def _format_float(v: float | None, unit: str = "", digits: int = 0) -> str:
 
 def _tz_aware_localize(dt: datetime.datetime) -> datetime.datetime:
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
+        dt = dt.replace(tzinfo=datetime.UTC)
     return dt.astimezone()
 
 
@@ -103,6 +115,14 @@ def _safe_avg(vals: Iterable[float]) -> float | None:
 # ---------- History Page UI ----------
 
 
+class _ActivityItem(GObject.Object):
+    """List model item wrapping one ``ActivityStats`` row."""
+
+    def __init__(self, stats: ActivityStats) -> None:
+        super().__init__()
+        self.stats = stats
+
+
 class HistoryPageUI:
     def __init__(self, app) -> None:
         self.app = app
@@ -113,19 +133,54 @@ class HistoryPageUI:
         self.selected_ids: set[int] = set()
 
         self._listbox: Gtk.ListBox | None = None
-        # Cached flat stats rows (ActivityStats ORM objects) in display order.
+        # Backing model for the list: every activity, in display order. The date
+        # filter sits on top of it, so switching filters only adds or removes
+        # the cards that cross the cutoff; cards come from the ListBox binding.
+        self._store = Gio.ListStore.new(_ActivityItem)
+        self._cutoff: datetime.datetime | None = None
+        self._filter = Gtk.CustomFilter.new(self._item_in_window)
+        self._filtered = Gtk.FilterListModel.new(self._store, self._filter)
+        # Cached flat stats rows (ActivityStats ORM objects) in display order:
+        # all of them, and the ones inside the current filter window.
+        self._all_rows: list[ActivityStats] = []
         self._displayed: list[ActivityStats] = []
+        # A backfill can be started from the main loop (refresh) or from a
+        # worker thread (refresh_from_worker), so the flag is lock-guarded
+        self._backfill_lock = threading.Lock()
+        self._stats_backfill_in_progress = False
+
+        # Per-activity (seconds, bpm) arrays shared by sparklines and the compare
+        # chart, least recently used first; recorded samples don't change, so
+        # entries are only evicted for space or when the DB changes
+        self._hr_cache: OrderedDict[int, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        self._hr_cache_db = None
 
         # Compare chart
         self._cmp_fig = None
         self._cmp_ax = None
         self._cmp_canvas = None
         self._cmp_metric_id = "hr"
+        # Line per activity id (None when it has no data for the metric), valid
+        # for the (metric, database) pair they were plotted from
+        self._cmp_lines: dict = {}
+        self._cmp_lines_key = None
+        # Compare legend labels, formatted once from the local start time when
+        # the activity's card is built
+        self._cmp_labels: dict[int, str] = {}
 
     def refresh(self) -> None:
         """Full reload from the stats table.  Safe to call from GLib.idle_add."""
         self._reload_everything()
 
+    def refresh_from_worker(self) -> None:
+        """Full reload for callers that are already on a background thread.
+
+        The stats backfill runs on the calling thread and only the rebind is
+        posted to the main loop, instead of starting another worker.
+        """
+        if self._begin_backfill():
+            self._backfill_and_rebind()
+
     def append_activity(self, activity_id: int) -> None:
         """Partial refresh: add a newly-computed activity card to the list.
 
@@ -141,11 +196,27 @@ class HistoryPageUI:
                 logger.warning(f"append_activity: no stats row for {activity_id}")
                 return
 
-        # Add to internal cache; resort and rebind so current sort order is preserved
-        self._displayed.append(row)
-        if self._listbox:
-            # Re-apply active sort and rebuild the listbox/summary bindings
-            self._resort_and_rebind()
+        # May have been cached, or already listed, mid-recording by a reload
+        self._hr_cache.pop(activity_id, None)
+        line = self._cmp_lines.pop(activity_id, None)
+        if line is not None:
+            line.remove()
+        self._all_rows = [r for r in self._all_rows if r.activity_id != activity_id]
+        for i in range(self._store.get_n_items()):
+            if self._store.get_item(i).stats.activity_id == activity_id:
+                self._store.remove(i)
+                break
+
+        # Add to internal cache, keeping the current sort order. The store
+        # mirrors _all_rows even before the page is built; only the new card
+        # is created (and its sparkline rendered), slotted in place.
+        self._all_rows.append(row)
+        self._all_rows = self._sort_rows(self._all_rows)
+        self._store.insert(self._all_rows.index(row), _ActivityItem(row))
+        if not self._listbox:
+            return
+        self._displayed = self._rows_in_window()
+        self._bind_summary(self._displayed)
 
     def build_page(self) -> Gtk.Widget:
         outer = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
@@ -226,6 +297,11 @@ class HistoryPageUI:
         scroller.set_vexpand(True)
         self._listbox = Gtk.ListBox()
         self._listbox.set_selection_mode(Gtk.SelectionMode.NONE)
+        empty = Gtk.Label(label="No activities in this time window.")
+        empty.set_wrap(True)
+        empty.set_xalign(0.5)
+        self._listbox.set_placeholder(empty)
+        self._listbox.bind_model(self._filtered, self._create_activity_row)
         scroller.set_child(self._listbox)
         activities_box.append(scroller)
 
@@ -251,19 +327,10 @@ class HistoryPageUI:
         compare_box.append(ctrl_cmp)
 
         compare_box.append(Gtk.Label(label="Compare selected activities (toggle on each card)."))
-        cmp_frame = Gtk.Frame()
-        self._cmp_fig = Figure(figsize=(6, 3), dpi=96, constrained_layout=True)
-        self._cmp_ax = self._cmp_fig.add_subplot(111)
-
-        # Initial style (HR as default)
-        self._apply_chart_style(self._cmp_ax, draw_hr_zones=True)
-        self._cmp_ax.set_xlabel("Time (s)", color=self.app.DARK_FG)
-        # Y label will be set by _redraw_compare_chart() based on metric
-
-        self._cmp_canvas = FigureCanvas(self._cmp_fig)
-        self._cmp_canvas.set_vexpand(True)
-        cmp_frame.set_child(self._cmp_canvas)
-        compare_box.append(cmp_frame)
+        # The chart itself is created the first time the Compare tab is shown
+        self._cmp_frame = Gtk.Frame()
+        self._cmp_frame.set_vexpand(True)
+        compare_box.append(self._cmp_frame)
 
         page = self.stack.add_titled(activities_box, "activities", "Activities")
         page.set_icon_name("view-list-symbolic")
@@ -287,6 +354,29 @@ class HistoryPageUI:
         is_compare = stack.get_visible_child_name() == "compare"
         self._top_controls.set_visible(not is_compare)
         self.summary_box.set_visible(not is_compare)
+        if is_compare and self._cmp_canvas is None:
+            self._build_compare_chart()
+            self._redraw_compare_chart()
+
+    def _build_compare_chart(self) -> None:
+        # Matplotlib is imported here rather than at module level so it isn't
+        # loaded before the main window is up
+        from matplotlib.backends.backend_gtk4cairo import (  # noqa: PLC0415
+            FigureCanvasGTK4Cairo as FigureCanvas,
+        )
+        from matplotlib.figure import Figure  # noqa: PLC0415
+
+        self._cmp_fig = Figure(figsize=(6, 3), dpi=96, constrained_layout=True)
+        self._cmp_ax = self._cmp_fig.add_subplot(111)
+
+        # Initial style (HR as default)
+        self._apply_chart_style(self._cmp_ax, draw_hr_zones=True)
+        self._cmp_ax.set_xlabel("Time (s)", color=self.app.DARK_FG)
+        # Y label will be set by _redraw_compare_chart() based on metric
+
+        self._cmp_canvas = FigureCanvas(self._cmp_fig)
+        self._cmp_canvas.set_vexpand(True)
+        self._cmp_frame.set_child(self._cmp_canvas)
 
     # ---- Summary header (totals) ----
     def _build_summary_header(self) -> Gtk.Widget:
@@ -322,7 +412,9 @@ class HistoryPageUI:
     # ---- Event handlers ----
     def _on_filter_changed(self, combo: Gtk.ComboBoxText) -> None:
         self.filter_id = combo.get_active_id()
-        GLib.idle_add(self._reload_everything)
+        # Rows are already loaded; only the filter window moves
+        self._apply_filter()
+        self._bind_summary(self._displayed)
 
     def _on_sort_changed(self, combo: Gtk.ComboBoxText) -> None:
         self.sort_id = combo.get_active_id()
@@ -333,8 +425,30 @@ class HistoryPageUI:
         self._redraw_compare_chart()
 
     # ---- Data fetchers ----
+    def _apply_filter(self) -> None:
+        self._cutoff = self._filter_cutoff()
+        self._filter.changed(Gtk.FilterChange.DIFFERENT)
+        self._displayed = self._rows_in_window()
+
+    def _row_in_window(self, row: ActivityStats) -> bool:
+        if self._cutoff is None:
+            return True
+        start = row.start_time
+        if start.tzinfo is None:
+            # SQLite hands the stored UTC time back naive
+            start = start.replace(tzinfo=datetime.UTC)
+        return start >= self._cutoff
+
+    def _item_in_window(self, item: _ActivityItem) -> bool:
+        return self._row_in_window(item.stats)
+
+    def _rows_in_window(self) -> list[ActivityStats]:
+        return [r for r in self._all_rows if self._row_in_window(r)]
+
     def _filter_cutoff(self) -> datetime.datetime | None:
-        now = datetime.datetime.now().astimezone()
+        # UTC, like the stored start times: no local-zone lookup, and SQLite
+        # compares the stored digits without applying any offset
+        now = datetime.datetime.now(datetime.UTC)
         if self.filter_id == "week":
             return now - datetime.timedelta(days=7)
         if self.filter_id == "month":
@@ -342,20 +456,16 @@ class HistoryPageUI:
         return None
 
     def _fetch_stats_rows(self) -> list[ActivityStats]:
-        """Single SELECT against activity_stats with optional cutoff filter."""
+        """Single SELECT against activity_stats; the date filter is applied by the list model."""
         if not self.app.recorder:
             return []
 
-        cutoff = self._filter_cutoff()
         with self.app.recorder.db.Session() as session:
-            q = session.query(ActivityStats).filter(
-                ActivityStats.sport_type_id != SportTypesEnum.unknown.value,
+            return (
+                session.query(ActivityStats)
+                .filter(ActivityStats.sport_type_id != SportTypesEnum.unknown.value)
+                .all()
             )
-            if cutoff:
-                # start_time is stored UTC-aware; cutoff is local-aware — both
-                # are comparable once Python converts to UTC internally.
-                q = q.filter(ActivityStats.start_time >= cutoff)
-            return q.all()
 
     def _sort_rows(self, rows: list[ActivityStats]) -> list[ActivityStats]:
         key_funcs: dict[str, object] = {
@@ -373,38 +483,10 @@ class HistoryPageUI:
     # ------------------------------------------------------------------
 
     def _reload_everything(self) -> bool:
-        if not self.app.recorder:
-            return False
-
-        # Avoid kicking off multiple concurrent backfills if refresh is
-        # requested repeatedly while one is already running.
-        if getattr(self, "_stats_backfill_in_progress", False):
+        if not self._begin_backfill():
             return False
-        self._stats_backfill_in_progress = True
 
-        def _finish_reload() -> bool:
-            """Run lightweight UI updates on the GTK main thread."""
-            try:
-                rows = self._sort_rows(self._fetch_stats_rows())
-                self._displayed = rows
-                self._bind_summary(rows)
-                self._bind_list(rows)
-                self._redraw_compare_chart()
-            finally:
-                # Mark backfill as finished, even if something went wrong.
-                self._stats_backfill_in_progress = False
-            # Returning False removes this idle source.
-            return False
-
-        def _worker() -> None:
-            try:
-                # Perform potentially expensive computation off the main loop.
-                self.app.recorder.stat_calc.compute_all(force=False)
-            finally:
-                # Schedule UI update back on the GTK main thread.
-                GLib.idle_add(_finish_reload)
-
-        thread = threading.Thread(target=_worker, daemon=True)
+        thread = threading.Thread(target=self._backfill_and_rebind, daemon=True)
         thread.start()
 
         # Returning False removes the idle source that invoked this method.
@@ -412,12 +494,50 @@ class HistoryPageUI:
         # background work completes.
         return False  # GLib.idle_add return value
 
+    def _begin_backfill(self) -> bool:
+        if not self.app.recorder:
+            return False
+
+        # Avoid kicking off multiple concurrent backfills if refresh is
+        # requested repeatedly while one is already running.
+        with self._backfill_lock:
+            if self._stats_backfill_in_progress:
+                return False
+            self._stats_backfill_in_progress = True
+        return True
+
+    def _backfill_and_rebind(self) -> None:
+        """Backfill missing stats on the calling (worker) thread, then rebind."""
+        try:
+            # Perform potentially expensive computation off the main loop.
+            self.app.recorder.stat_calc.compute_all(force=False)
+        finally:
+            # Schedule UI update back on the GTK main thread.
+            GLib.idle_add(self._finish_reload)
+
+    def _finish_reload(self) -> bool:
+        """Run lightweight UI updates on the GTK main thread."""
+        try:
+            rows = self._sort_rows(self._fetch_stats_rows())
+            self._all_rows = rows
+            # Move the window first so the splice only builds cards inside it
+            self._apply_filter()
+            self._bind_list(rows)
+            self._bind_summary(self._displayed)
+            self._redraw_compare_chart(rebuild=True)
+        finally:
+            # Mark backfill as finished, even if something went wrong.
+            with self._backfill_lock:
+                self._stats_backfill_in_progress = False
+        # Returning False removes this idle source.
+        return False
+
     def _resort_and_rebind(self) -> bool:
         """Re-sort the already-fetched rows without hitting the DB again."""
-        rows = self._sort_rows(list(self._displayed))
-        self._displayed = rows
+        rows = self._sort_rows(self._all_rows)
         self._bind_list(rows)
-        self._bind_summary(rows)
+        self._displayed = self._rows_in_window()
+        self._bind_summary(self._displayed)
         self._redraw_compare_chart()
         return False
 
@@ -440,32 +560,17 @@ class HistoryPageUI:
 
     # ---- Bind list ----
     def _bind_list(self, items: list[ActivityStats]) -> None:
-        # Clear
-        if not self._listbox:
-            return
-        child = self._listbox.get_first_child()
-        while child:
-            nxt = child.get_next_sibling()
-            self._listbox.remove(child)
-            child = nxt
-
-        if not items:
-            empty = Gtk.Label(label="No activities in this time window.")
-            empty.set_wrap(True)
-            empty.set_xalign(0.5)
-            row = Gtk.ListBoxRow()
-            row.set_child(empty)
-            self._listbox.append(row)
-            return
+        # Swap the whole model in one splice so the ListBox sees a single
+        # items-changed instead of a remove/append per card
+        self._store.splice(0, self._store.get_n_items(), [_ActivityItem(s) for s in items])
 
-        for stats in items:
-            row = self._make_activity_row(stats)
-            setattr(row, "_activity_id", stats.activity_id)
-            self._listbox.append(row)
+    def _create_activity_row(self, item: _ActivityItem) -> Gtk.Widget:
+        return self._make_activity_row(item.stats)
 
     def _make_activity_row(self, stats: ActivityStats) -> Gtk.ListBoxRow:
         sport = SportTypesEnum(stats.sport_type_id)
         local_start = _tz_aware_localize(stats.start_time)
+        self._cmp_labels[stats.activity_id] = local_start.strftime("%Y-%m-%d %H:%M")
 
         row = Gtk.ListBoxRow()
         frame = Gtk.Frame()
@@ -565,45 +670,57 @@ class HistoryPageUI:
         metrics_lbl.set_selectable(False)
         box.append(metrics_lbl)
 
-        # Tiny sparkline (HR)
-        spark = self._build_sparkline(stats.activity_id)
-        if spark:
-            box.append(spark)
+        # Tiny sparkline (HR). Its query and canvas are deferred until the card
+        # is first mapped, so a reload doesn't pay for them while History is
+        # off screen.
+        spark_slot = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        box.append(spark_slot)
+
+        def _fill_sparkline(slot: Gtk.Box) -> None:
+            slot.disconnect(map_handler)
+            spark = self._build_sparkline(stats.activity_id)
+            if spark:
+                slot.append(spark)
+            else:
+                slot.set_visible(False)
+
+        map_handler = spark_slot.connect("map", _fill_sparkline)
 
         frame.set_child(box)
         row.set_child(frame)
         return row
 
+    def _hr_series(self, act_id: int) -> tuple[np.ndarray, np.ndarray]:
+        db = self.app.recorder.db
+        if db is not self._hr_cache_db:
+            self._hr_cache.clear()
+            self._hr_cache_db = db
+        series = self._hr_cache.get(act_id)
+        if series is None:
+            series = self._hr_cache[act_id] = db.heart_rate_series(act_id)
+            if len(self._hr_cache) > HR_SERIES_CACHE_SIZE:
+                self._hr_cache.popitem(last=False)
+        else:
+            self._hr_cache.move_to_end(act_id)
+        return series
+
     # Sparkline (targeted query — only when building the card)
     def _build_sparkline(self, act_id: int) -> Gtk.Widget | None:
         if not self.app.recorder:
             return None
 
-        with self.app.recorder.db.Session() as session:
-            hrs = (
-                session.query(HeartRate.timestamp_ms, HeartRate.bpm)
-                .filter_by(activity_id=act_id)
-                .order_by(HeartRate.timestamp_ms)
-                .all()
-            )
-        if not hrs:
+        xs, ys = self._hr_series(act_id)
+        if not len(xs):
             return None
 
-        t0 = hrs[0].timestamp_ms
-        xs = [(h.timestamp_ms - t0) / 1000.0 for h in hrs]
-        ys = [h.bpm for h in hrs]
-
-        fig = Figure(figsize=(2.5, 0.6), dpi=96)
-        ax = fig.add_axes([0, 0, 1, 1])
-        # Match app theme
-        fig.patch.set_facecolor(self.app.DARK_BG)
-        ax.set_facecolor(self.app.DARK_BG)
-        ax.plot(xs, ys, lw=1.2)
-        ax.axis("off")
-
-        canvas = FigureCanvas(fig)
-        canvas.set_size_request(260, 44)
-        return canvas
+        # A plain polyline; a Matplotlib figure per card is far too heavy
+        bg = Gdk.RGBA()
+        bg.parse(self.app.DARK_BG)  # Match app theme
+        area = Gtk.DrawingArea()
+        area.set_content_width(SPARKLINE_WIDTH_PX)
+        area.set_content_height(SPARKLINE_HEIGHT_PX)
+        area.set_draw_func(_draw_sparkline, (*decimate(xs, ys, SPARKLINE_WIDTH_PX), bg))
+        return area
 
     def _on_select_toggle(self, act_id: int, active: bool) -> None:
         if active:
@@ -614,137 +731,89 @@ class HistoryPageUI:
         self._redraw_compare_chart()
 
     # ---- Compare chart ----
-    def _redraw_compare_chart(self) -> None:
-        def mmss(x, _pos):
-            m, s = divmod(int(max(0, x)), 60)
-            return f"{m:d}:{s:02d}"
+    def _redraw_compare_chart(self, *, rebuild: bool = False) -> None:
+        """Show the selected activities on the compare chart.
 
+        Lines are kept per activity and only hidden when deselected, so toggling
+        a card plots at most the one new series. The axes are cleared only when
+        the metric or database changes, or when ``rebuild`` is set (after a
+        reload, so zones pick up changed settings).
+        """
         if not self._cmp_ax:
             return
         ax = self._cmp_ax
-        ax.clear()
-        # Draw HR zones only for the HR metric
-        hr_mode = self._cmp_metric_id == "hr"
-        self._apply_chart_style(ax, draw_hr_zones=hr_mode)
-
-        if not self.app.recorder or not self.selected_ids:
-            ax.set_title("Select activities to compare.", color=self.app.DARK_FG)
-            self._cmp_canvas.draw_idle()
-            return
-
-        max_t = 0.0
-        any_series = False
-        with self.app.recorder.db.Session() as session:
-            for aid in sorted(self.selected_ids):
-                act = session.get(Activity, aid)
-                if not act:
-                    continue
-                label = _tz_aware_localize(act.start_time).strftime("%Y-%m-%d %H:%M")
-
-                if self._cmp_metric_id == "hr":
-                    hrs = (
-                        session.query(HeartRate)
-                        .filter_by(activity_id=aid)
-                        .order_by(HeartRate.timestamp_ms)
-                        .all()
-                    )
-                    if not hrs:
-                        continue
-                    t0 = hrs[0].timestamp_ms
-                    xs = [(h.timestamp_ms - t0) / 1000.0 for h in hrs]
-                    ys = [h.bpm for h in hrs]
-                else:
-                    # Retrieve the pre-computed sport from activity_stats
-                    stats_row = (
-                        session.query(ActivityStats).filter_by(activity_id=aid).one_or_none()
-                    )
-                    if not stats_row:
-                        continue
-                    sport = SportTypesEnum(stats_row.sport_type_id)
-
-                    if sport == SportTypesEnum.running:
-                        primary = (
-                            session.query(RunningMetrics)
-                            .filter_by(activity_id=aid)
-                            .order_by(RunningMetrics.timestamp_ms)
-                            .all()
-                        )
-                    elif sport == SportTypesEnum.biking:
-                        primary = (
-                            session.query(CyclingMetrics)
-                            .filter_by(activity_id=aid)
-                            .order_by(CyclingMetrics.timestamp_ms)
-                            .all()
-                        )
-                    else:
-                        continue
-
-                    if not primary:
+        db = self.app.recorder.db if self.app.recorder else None
+        key = (self._cmp_metric_id, db)
+        if rebuild or key != self._cmp_lines_key:
+            self._reset_compare_axes()
+            self._cmp_lines_key = key
+
+        selected = self.selected_ids if db is not None else set()
+        missing = [aid for aid in sorted(selected) if aid not in self._cmp_lines]
+        if missing:
+            with db.Session() as session:
+                for aid in missing:
+                    series = self._compare_series(session, aid)
+                    if series is None:
+                        # Remember the miss so later toggles don't re-query it
+                        self._cmp_lines[aid] = None
                         continue
-
-                    t0 = primary[0].timestamp_ms
-                    xs = [(p.timestamp_ms - t0) / 1000.0 for p in primary]
-
-                    if self._cmp_metric_id == "pace":
-                        if sport != SportTypesEnum.running:
-                            continue
-                        vals = [_pace_min_per_mile_from_mps(float(p.speed_mps)) for p in primary]
-                        ys = [None if math.isinf(v) else v for v in vals]
-                    elif self._cmp_metric_id == "speed":
-                        ys = [
-                            (float(p.speed_mps) * 2.23693629) if p.speed_mps is not None else None
-                            for p in primary
-                        ]
-                    elif self._cmp_metric_id == "power":
-                        ys = [
-                            float(p.power_watts) if p.power_watts is not None else None
-                            for p in primary
-                        ]
-                    elif self._cmp_metric_id == "cadence":
-                        if sport == SportTypesEnum.running:
-                            ys = [
-                                float(p.cadence_spm) if p.cadence_spm is not None else None
-                                for p in primary
-                            ]
-                        else:
-                            ys = [
-                                float(p.cadence_rpm) if p.cadence_rpm is not None else None
-                                for p in primary
-                            ]
-                    else:
-                        ys = []
-
-                # Smooth: pace is spiky, use median; others use mean.
-                # ~15s window for HR/power/cadence/speed/pace.
-                # Estimate sample rate from xs to convert seconds -> samples.
-                if len(xs) >= 2:
-                    dt = (xs[-1] - xs[0]) / max(1, len(xs) - 1)
-                    sample_hz = 1.0 / dt if dt > 0 else 1.0
-                else:
-                    sample_hz = 1.0
-
-                window = max(3, int(round(15 * sample_hz)))
-                ys = _rolling(ys, window, use_median=False)
-
-                any_series = True
-                if xs:
-                    max_t = max(max_t, xs[-1])
-                    ax.plot(xs, ys, lw=2, label=label)
-
-        if not any_series:
-            ax.set_title("No data available for the chosen metric.", color=self.app.DARK_FG)
+                    xs, ys, label = series
+                    # About one point per pixel of the chart's current width
+                    xs, ys = decimate(xs, ys, max(self._cmp_canvas.get_width(), 600))
+                    (self._cmp_lines[aid],) = ax.plot(xs, ys, lw=2, label=label)
+
+        shown = []
+        for aid, line in sorted(self._cmp_lines.items()):
+            if line is None:
+                continue
+            line.set_visible(aid in selected)
+            if aid in selected:
+                shown.append(line)
+
+        legend = ax.get_legend()
+        if legend is not None:
+            legend.remove()
+
+        if not shown:
+            if selected:
+                ax.set_title("No data available for the chosen metric.", color=self.app.DARK_FG)
+            else:
+                ax.set_title("Select activities to compare.", color=self.app.DARK_FG)
             self._cmp_canvas.draw_idle()
             return
+        ax.set_title("")
 
+        max_t = max(line.get_xdata()[-1] for line in shown)
         if max_t > 0:
             ax.set_xlim(0, max_t)
-            ax.xaxis.set_major_formatter(FuncFormatter(mmss))
-            leg = ax.legend(loc="lower right", frameon=True, ncol=1)
+            leg = ax.legend(handles=shown, loc="lower right", frameon=True, ncol=1)
             leg.get_frame().set_facecolor(self.app.DARK_BG)
             leg.get_frame().set_edgecolor(self.app.DARK_GRID)
             for t in leg.get_texts():
                 t.set_color(self.app.DARK_FG)
 
+        # Fit Y to the visible lines only
+        ax.relim(visible_only=True)
+        ax.autoscale_view(scalex=False)
+
+        self._cmp_canvas.draw_idle()
+
+    def _reset_compare_axes(self) -> None:
+        def mmss(x, _pos):
+            m, s = divmod(int(max(0, x)), 60)
+            return f"{m:d}:{s:02d}"
+
+        ax = self._cmp_ax
+        ax.clear()
+        self._cmp_lines.clear()
+        # Draw HR zones only for the HR metric
+        self._apply_chart_style(ax, draw_hr_zones=self._cmp_metric_id == "hr")
+
+        from matplotlib.ticker import FuncFormatter  # noqa: PLC0415
+
+        ax.xaxis.set_major_formatter(FuncFormatter(mmss))
+
         # Y-axis label per metric
         ylabels = {
             "hr": "BPM",
@@ -759,7 +828,89 @@ class HistoryPageUI:
         if self._cmp_metric_id == "pace":
             ax.invert_yaxis()
 
-        self._cmp_canvas.draw_idle()
+    def _compare_series(
+        self,
+        session: Session,
+        aid: int,
+    ) -> tuple[np.ndarray, np.ndarray, str] | None:
+        """Smoothed (seconds, value) series and legend label for one activity."""
+        label = self._cmp_labels.get(aid)
+        if label is None:
+            # Selected under another filter, so no card has been built for it
+            act = session.get(Activity, aid)
+            if not act:
+                return None
+            label = _tz_aware_localize(act.start_time).strftime("%Y-%m-%d %H:%M")
+            self._cmp_labels[aid] = label
+
+        if self._cmp_metric_id == "hr":
+            xs, ys = self._hr_series(aid)
+        else:
+            xs, ys = self._metric_series(session, aid)
+        if not len(xs):
+            return None
+
+        # Smooth: pace is spiky, use median; others use mean.
+        # ~15s window for HR/power/cadence/speed/pace.
+        # Estimate sample rate from xs to convert seconds -> samples.
+        if len(xs) >= 2:
+            dt = (xs[-1] - xs[0]) / max(1, len(xs) - 1)
+            sample_hz = 1.0 / dt if dt > 0 else 1.0
+        else:
+            sample_hz = 1.0
+
+        window = max(3, int(round(15 * sample_hz)))
+        return xs, rolling(ys, window, use_median=False), label
+
+    def _metric_series(self, session: Session, aid: int) -> tuple[np.ndarray, np.ndarray]:
+        """Unsmoothed (seconds, value) arrays for a non-HR compare metric."""
+        empty = (np.empty(0), np.empty(0))
+        # Retrieve the pre-computed sport from activity_stats
+        stats_row = session.query(ActivityStats).filter_by(activity_id=aid).one_or_none()
+        if not stats_row:
+            return empty
+        sport = SportTypesEnum(stats_row.sport_type_id)
+
+        # Only the timestamp and the one plotted column, as plain rows
+        if sport == SportTypesEnum.running:
+            model = RunningMetrics
+            columns = {
+                "pace": model.speed_mps,
+                "speed": model.speed_mps,
+                "power": model.power_watts,
+                "cadence": model.cadence_spm,
+            }
+        elif sport == SportTypesEnum.biking:
+            model = CyclingMetrics
+            columns = {
+                "speed": model.speed_mps,
+                "power": model.power_watts,
+                "cadence": model.cadence_rpm,
+            }
+        else:
+            return empty
+
+        column = columns.get(self._cmp_metric_id)
+        if column is None:
+            return empty
+        primary = session.execute(
+            select(model.timestamp_ms, column)
+            .where(model.activity_id == aid)
+            .order_by(model.timestamp_ms),
+        ).all()
+        if not primary:
+            return empty
+
+        # (timestamp, value) rows as one float array; NULLs become NaN gaps
+        data = np.array(primary, dtype=np.float64)
+        xs = (data[:, 0] - data[0, 0]) / 1000.0
+        if self._cmp_metric_id == "pace":
+            ys = _pace_min_per_mile_from_mps(data[:, 1])
+        elif self._cmp_metric_id == "speed":
+            ys = data[:, 1] * 2.23693629
+        else:
+            ys = data[:, 1]
+        return xs, ys
 
     # Export
     def _on_export_clicked(self, act_id: int) -> None:
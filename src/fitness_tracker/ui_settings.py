@@ -9,7 +9,6 @@ from typing import TYPE_CHECKING, Any
 
 import gi
 import requests
-from bleak import BleakScanner
 from bleaksport import (
     MachineType,
     discover_ftms_devices,
@@ -234,10 +233,13 @@ def fallback_settings(file: Path) -> AppSettings | None:
 class SettingsPageUI:
     def __init__(self, app):
         self.app = app
-        # Bleak keeps one BlueZ manager per event loop. Serialize the short-lived
-        # settings loops so a burst of button clicks cannot create overlapping
-        # managers and scans.
+        # Bleak keeps one BlueZ manager per event loop. All settings scans run on
+        # one long-lived loop (started on first use) so the manager and its D-Bus
+        # connection are reused across rescans, and the lock keeps a burst of
+        # button clicks from running overlapping scans.
         self._ble_scan_lock = threading.Lock()
+        self._ble_loop: asyncio.AbstractEventLoop | None = None
+        self._settings_write_lock = threading.Lock()
 
         # Widgets to toggle
         self.pebble_row: Adw.ActionRow | None = None
@@ -1081,14 +1083,31 @@ class SettingsPageUI:
         scan_factory: Callable[[], Coroutine[Any, Any, T]],
     ) -> T:
         with self._ble_scan_lock:
-            return asyncio.run(scan_factory())
+            if self._ble_loop is None:
+                self._ble_loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._ble_loop.run_forever,
+                    name="settings-ble-loop",
+                    daemon=True,
+                ).start()
+            return asyncio.run_coroutine_threadsafe(scan_factory(), self._ble_loop).result()
+
+    def _start_scanning(self, rows: list[tuple[Gtk.Spinner, Adw.ActionRow]], subtitle: str) -> None:
+        """Start the spinners and set the "scanning" subtitles in one main-loop callback."""
+
+        def _apply() -> bool:
+            for spinner, row in rows:
+                spinner.start()
+                row.set_subtitle(subtitle)
+            return False
+
+        GLib.idle_add(_apply)
 
     def _fill_devices_hr(self):
-        GLib.idle_add(self.hr_spinner.start)
-        self.hr_row.set_subtitle("Scanning for HRM…")
-
-        GLib.idle_add(self.cycling_hr_spinner.start)
-        self.cycling_hr_row.set_subtitle("Scanning for HRM…")
+        self._start_scanning(
+            [(self.hr_spinner, self.hr_row), (self.cycling_hr_spinner, self.cycling_hr_row)],
+            "Scanning for HRM…",
+        )
 
         async def _scan():
             devices = await discover_heart_rate_devices(scan_timeout=5.0)
@@ -1119,17 +1138,15 @@ class SettingsPageUI:
         self._run_ble_scan(_scan)
 
     def _fill_devices_speed_cadence(self):
-        GLib.idle_add(self.speed_spinner.start)
-        self.speed_row.set_subtitle("Scanning for speed/cadence devices…")
-
-        GLib.idle_add(self.cadence_spinner.start)
-        self.cadence_row.set_subtitle("Scanning for speed/cadence devices…")
-
-        GLib.idle_add(self.cycling_speed_spinner.start)
-        self.cycling_speed_row.set_subtitle("Scanning for speed/cadence devices…")
-
-        GLib.idle_add(self.cycling_cadence_spinner.start)
-        self.cycling_cadence_row.set_subtitle("Scanning for speed/cadence devices…")
+        self._start_scanning(
+            [
+                (self.speed_spinner, self.speed_row),
+                (self.cadence_spinner, self.cadence_row),
+                (self.cycling_speed_spinner, self.cycling_speed_row),
+                (self.cycling_cadence_spinner, self.cycling_cadence_row),
+            ],
+            "Scanning for speed/cadence devices…",
+        )
 
         async def _scan():
             devices = await discover_speed_cadence_devices(scan_timeout=5.0)
@@ -1179,11 +1196,13 @@ class SettingsPageUI:
         self._run_ble_scan(_scan)
 
     def _fill_devices_power(self):
-        GLib.idle_add(self.power_spinner.start)
-        self.power_row.set_subtitle("Scanning for power devices…")
-
-        GLib.idle_add(self.cycling_power_spinner.start)
-        self.cycling_power_row.set_subtitle("Scanning for power devices…")
+        self._start_scanning(
+            [
+                (self.power_spinner, self.power_row),
+                (self.cycling_power_spinner, self.cycling_power_row),
+            ],
+            "Scanning for power devices…",
+        )
 
         async def _scan():
             devices = await discover_power_devices(scan_timeout=5.0)
@@ -1214,8 +1233,7 @@ class SettingsPageUI:
         self._run_ble_scan(_scan)
 
     def _fill_devices_trainer_hr(self, spinner, row, combo, settings_hr_name, map_attr: str):
-        GLib.idle_add(spinner.start)
-        GLib.idle_add(row.set_subtitle, "Scanning for HRM…")
+        self._start_scanning([(spinner, row)], "Scanning for HRM…")
 
         async def _scan():
             devices = await discover_heart_rate_devices(scan_timeout=5.0)
@@ -1251,8 +1269,7 @@ class SettingsPageUI:
         )
 
     def _fill_devices_trainer(self, spinner, row, combo, settings_trainer_name, map_attr: str):
-        GLib.idle_add(spinner.start)
-        GLib.idle_add(row.set_subtitle, "Scanning for FTMS trainers…")
+        self._start_scanning([(spinner, row)], "Scanning for FTMS trainers…")
 
         async def _scan():
             found = await discover_ftms_devices(scan_timeout=5.0)
@@ -1300,8 +1317,7 @@ class SettingsPageUI:
         if not self.pebble_spinner or not self.pebble_row or not self.pebble_combo:
             return
 
-        GLib.idle_add(self.pebble_spinner.start)
-        GLib.idle_add(self.pebble_row.set_subtitle, "Scanning for Pebble…")
+        self._start_scanning([(self.pebble_spinner, self.pebble_row)], "Scanning for Pebble…")
 
         async def _scan() -> dict[str, str]:
             mapping: dict[str, str] = {}
@@ -1354,11 +1370,12 @@ class SettingsPageUI:
             if not self.pebble_spinner or not self.pebble_row or not self.pebble_combo:
                 return
 
+            error: str | None = None
             try:
                 name_to_mac = self._run_ble_scan(_scan)
             except Exception as e:
                 name_to_mac = {}
-                GLib.idle_add(self.pebble_row.set_subtitle, f"Scan failed: {e}")
+                error = f"Scan failed: {e}"
 
             display_map = _uniq_display_names(name_to_mac)
             names = sorted(display_map.keys())
@@ -1371,16 +1388,15 @@ class SettingsPageUI:
                 self.pebble_combo.remove_all()
                 for disp in names:
                     self.pebble_combo.append_text(disp)
-                if not names:
-                    self.pebble_row.set_subtitle("No Pebble devices found")
-                else:
-                    self.pebble_row.set_subtitle("")
-                    # auto-select saved MAC if present
-                    if self.app.app_settings.pebble.address:
-                        for i, disp in enumerate(names):
-                            if display_map[disp] == self.app.app_settings.pebble.address:
-                                self.pebble_combo.set_active(i)
-                                break
+                self.pebble_row.set_subtitle(
+                    error or ("" if names else "No Pebble devices found"),
+                )
+                # auto-select saved MAC if present
+                if names and self.app.app_settings.pebble.address:
+                    for i, disp in enumerate(names):
+                        if display_map[disp] == self.app.app_settings.pebble.address:
+                            self.pebble_combo.set_active(i)
+                            break
                 self.pebble_map = display_map
                 return False
 
@@ -1619,7 +1635,6 @@ class SettingsPageUI:
                     sel,
                 )
 
-        self.app.app_settings.save()
         self._update_actions_state()
 
         # Apply Pebble settings right away (start/stop bridge without restart)
@@ -1628,34 +1643,56 @@ class SettingsPageUI:
         # Apply sensor settings right away (start/stop recorder with new sensors without restart)
         GLib.idle_add(self.app.apply_sensor_settings)
 
-        toast = Adw.Toast.new("Settings saved successfully")
-        GLib.idle_add(self.app.toast_overlay.add_toast, toast)
-
         GLib.idle_add(self.app.tracker.redraw)
 
+        # Write the file off the main loop. The copy keeps a later save's edits
+        # out of this write, and the lock keeps writes in click order.
+        snapshot = self.app.app_settings.model_copy(deep=True)
+        threading.Thread(target=self._write_settings, args=(snapshot,), daemon=True).start()
+
+    def _write_settings(self, settings: AppSettings) -> None:
+        with self._settings_write_lock:
+            try:
+                settings.save()
+            except Exception as e:
+                # on a worker thread nothing else would report it
+                logger.error(f"Saving settings failed: {e}")
+                GLib.idle_add(self.app.show_toast, f"Saving settings failed: {e}")
+                return
+        GLib.idle_add(self.app.show_toast, "Settings saved successfully")
+
     def _on_sync(self, button: Gtk.Button):
         # disable the Settings-page sync button
         button.set_sensitive(False)
-        GLib.idle_add(self.app.show_toast, "Syncing…")
+        self.app.show_toast("Syncing…")
+
+        def _finish(message: str) -> bool:
+            # every follow-up UI change in one main-loop callback
+            self.app.show_toast(message)
+            button.set_sensitive(True)
+            return False
 
         def do_sync():
             if not self.app.app_settings.database.dsn:
-                GLib.idle_add(self.app.show_toast, "No database DSN configured")
-                GLib.idle_add(button.set_sensitive, True)
+                GLib.idle_add(_finish, "No database DSN configured")
                 return
 
             try:
                 self.app.recorder.db.sync_to_database(self.app.app_settings.database.dsn)
             except ConnectionError as e:
-                GLib.idle_add(self.app.show_toast, f"Sync failed: {e}")
-                GLib.idle_add(button.set_sensitive, True)
+                GLib.idle_add(_finish, f"Sync failed: {e}")
                 return
 
-            # refresh history after a successful sync
-            GLib.idle_add(self.app.history.refresh)
-
-            GLib.idle_add(self.app.show_toast, "Sync complete")
-            GLib.idle_add(button.set_sensitive, True)
+            # refresh history after a successful sync; the stats backfill for
+            # pulled activities runs here instead of on another thread, so a
+            # failure must not keep _finish from re-enabling the button
+            try:
+                self.app.history.refresh_from_worker()
+            except Exception as e:
+                logger.error(f"History refresh after sync failed: {e}")
+                GLib.idle_add(_finish, f"Sync complete, but refreshing history failed: {e}")
+                return
+            GLib.idle_add(_finish, "Sync complete")
 
         threading.Thread(target=do_sync, daemon=True).start()
 
@@ -3,12 +3,10 @@ from __future__ import annotations
 import math
 import random
 import time
-from collections import deque
 from dataclasses import replace
 from typing import TYPE_CHECKING
 
 import gi
-import numpy as np
 from bleaksport import CyclingSample, HeartRateSample, RunningSample, TrainerSample
 from workout_parser import (
     DistanceDuration,
@@ -21,6 +19,7 @@ from workout_parser import (
 from workout_parser.main import pretty_workout_name
 
 from fitness_tracker.database import SportTypesEnum
+from fitness_tracker.series import SampleWindow
 from fitness_tracker.ui_free_run import FreeRunView
 from fitness_tracker.ui_mode import IndoorOutdoorEnum, ModeSelectView
 from fitness_tracker.ui_workout import WorkoutView
@@ -48,9 +47,10 @@ class TrackerPageUI:
         # buffers (ms + values)
         self.window_sec = 60
         self.window_ms = self.window_sec * 1000.0
-        self._times = deque()
-        self._bpms = deque()
-        self._powers = deque()
+        self._window = SampleWindow()
+        # the chart is redrawn at most this often; cards still update per sample
+        self.chart_interval_s = 0.25
+        self._last_chart_s = 0.0
         self._last_ms: int | None = None
         self._erg_last_set_watts: int | None = None
         self._erg_last_set_ts: float = 0.0
@@ -545,21 +545,21 @@ class TrackerPageUI:
         self._bpm_max = max(self._bpm_max, bpm)
 
         cutoff = t_ms - self.window_ms
-        self._times.append(t_ms)
-        self._bpms.append(bpm)
-        self._powers.append(watts)
-        while self._times and self._times[0] < cutoff:
-            self._times.popleft()
-            self._bpms.popleft()
-            self._powers.popleft()
-
-        # Build arrays for free-view chart (if visible)
-        x = (np.array(self._times) - cutoff) / 1000.0 if self._times else np.array([])
-        hr = np.array(self._bpms) if self._bpms else np.array([])
-        pw = np.array(self._powers) if self._powers else np.array([])
-        _, _, _, rgb = self._zone_info(self._bpms[-1]) if self._bpms else ("", 0, 0, (1, 1, 1))
-
-        if self.free_view and hasattr(self.free_view, "update_chart"):
+        self._window.append(t_ms, bpm, watts)
+        self._window.trim_before(cutoff)
+
+        # Views into the window for the free-view chart (if visible), rate limited
+        now_s = time.monotonic()
+        if (
+            self.free_view
+            and hasattr(self.free_view, "update_chart")
+            and now_s - self._last_chart_s >= self.chart_interval_s
+        ):
+            self._last_chart_s = now_s
+            x = (self._window.times - cutoff) / 1000.0
+            hr = self._window.bpms
+            pw = self._window.powers
+            _, _, _, rgb = self._zone_info(bpm)
             self.free_view.update_chart(x, hr, pw, hr_rgb=rgb)
 
         # cards/timer
@@ -1208,9 +1208,8 @@ class TrackerPageUI:
 
     # ---- resets & utils
     def _reset_buffers(self) -> None:
-        self._times.clear()
-        self._bpms.clear()
-        self._powers.clear()
+        self._window.clear()
+        self._last_chart_s = 0.0
         self._last_ms = None
         self._bpm_max = 0
         self._workout_distance_accumulator.reset()
@@ -0,0 +1,226 @@
+# ruff: noqa: ANN001, PLR2004, SLF001
+
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+from fitness_tracker.database import (
+    Activity,
+    DatabaseManager,
+    HeartRate,
+    SportTypesEnum,
+    _sqlite_insert_rows,
+)
+from sqlalchemy import event, func, select
+
+
+def _hr_rows(activity_id: int, count: int) -> list[dict]:
+    return [
+        {
+            "activity_id": activity_id,
+            "timestamp_ms": i * 1000,
+            "bpm": 100 + i,
+            "rr_interval": None,
+            "energy_kj": 0.1,
+        }
+        for i in range(count)
+    ]
+
+
+def _capture_statements(db: DatabaseManager) -> list[tuple[str, bool]]:
+    statements: list[tuple[str, bool]] = []
+
+    def _record(_conn, _cursor, statement, _params, _context, executemany) -> None:
+        if statement.startswith("INSERT INTO heart_rate"):
+            statements.append((statement, executemany))
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    return statements
+
+
+def _stored_bpms(db: DatabaseManager, activity_id: int) -> list[int]:
+    with db.Session() as session:
+        return list(
+            session.scalars(
+                select(HeartRate.bpm)
+                .where(HeartRate.activity_id == activity_id)
+                .order_by(HeartRate.timestamp_ms),
+            ),
+        )
+
+
+def test_sqlite_insert_rows_uses_fixed_chunks_and_a_remainder() -> None:
+    db = DatabaseManager("sqlite:///:memory:")
+    aid = db.start_activity(SportTypesEnum.running)
+    statements = _capture_statements(db)
+
+    with db.engine.begin() as conn:
+        _sqlite_insert_rows(conn, "heart_rate", _hr_rows(aid, 250))
+
+    # two full 100-row chunks share one SQL text, the last 50 rows are an executemany
+    assert [many for _sql, many in statements] == [False, False, True]
+    assert statements[0][0] == statements[1][0]
+    assert statements[0][0].count("?") == 100 * 5
+    assert statements[2][0].count("?") == 5
+    assert _stored_bpms(db, aid) == [100 + i for i in range(250)]
+    db.close()
+
+
+def test_sqlite_insert_rows_stays_under_the_variable_limit() -> None:
+    db = DatabaseManager("sqlite:///:memory:")
+    aid = db.start_activity(SportTypesEnum.running)
+    statements = _capture_statements(db)
+
+    with db.engine.begin() as conn:
+        conn.connection.driver_connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 12)
+        _sqlite_insert_rows(conn, "heart_rate", _hr_rows(aid, 23))
+
+    # 12 variables fit two 5-column rows per statement
+    assert all(sql.count("?") <= 12 for sql, _many in statements)
+    assert len(statements) == 12
+    assert len({sql for sql, _many in statements}) == 2
+    assert _stored_bpms(db, aid) == [100 + i for i in range(23)]
+    db.close()
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def _insert_samples(db: DatabaseManager, activity_id: int, count: int, first: int = 0) -> None:
+    for i in range(first, first + count):
+        db.insert_heart_rate(activity_id, i * 1000, 100 + i, None, None)
+
+
+def test_in_memory_database_flushes_inline_without_a_writer_thread() -> None:
+    db = DatabaseManager("sqlite:///:memory:")
+    aid = db.start_activity(SportTypesEnum.running)
+
+    assert db._writer is None
+    _insert_samples(db, aid, DatabaseManager.BATCH_SIZE)
+
+    # the full batch was written by the insert call itself
+    assert len(db._pending_hr) == 0
+    assert len(_stored_bpms(db, aid)) == DatabaseManager.BATCH_SIZE
+    db.close()
+
+
+def test_writer_thread_flushes_a_full_batch(tmp_path: Path) -> None:
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'fitness.db'}")
+    aid = db.start_activity(SportTypesEnum.running)
+
+    assert db._writer is not None
+    _insert_samples(db, aid, DatabaseManager.BATCH_SIZE - 1)
+    time.sleep(0.1)
+    assert _stored_bpms(db, aid) == []
+
+    _insert_samples(db, aid, 1, first=DatabaseManager.BATCH_SIZE - 1)
+    assert _wait_for(lambda: len(_stored_bpms(db, aid)) == DatabaseManager.BATCH_SIZE)
+    db.close()
+
+
+def test_writer_thread_flushes_after_the_interval(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(DatabaseManager, "FLUSH_INTERVAL_S", 0.05)
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'fitness.db'}")
+    aid = db.start_activity(SportTypesEnum.running)
+
+    _insert_samples(db, aid, 3)
+
+    assert _wait_for(lambda: _stored_bpms(db, aid) == [100, 101, 102])
+    db.close()
+
+
+def test_failed_flush_restages_rows_in_order(monkeypatch) -> None:
+    db = DatabaseManager("sqlite:///:memory:")
+    aid = db.start_activity(SportTypesEnum.running)
+    _insert_samples(db, aid, 3)
+
+    def _fail(*_args: object) -> None:
+        msg = "database is locked"
+        raise OSError(msg)
+
+    with monkeypatch.context() as m:
+        m.setattr(DatabaseManager, "_write_pending", staticmethod(_fail))
+        with pytest.raises(OSError, match="locked"):
+            db._flush_pending()
+
+    # rows staged after the failure queue up behind the restored batch
+    _insert_samples(db, aid, 1, first=3)
+    assert len(db._pending_hr) == 4
+
+    db._flush_pending()
+    assert _stored_bpms(db, aid) == [100, 101, 102, 103]
+    db.close()
+
+
+def test_close_writes_out_staged_rows(tmp_path: Path) -> None:
+    url = f"sqlite:///{tmp_path / 'fitness.db'}"
+    db = DatabaseManager(url)
+    aid = db.start_activity(SportTypesEnum.running)
+    _insert_samples(db, aid, 5)
+
+    db.close()
+
+    reopened = DatabaseManager(url)
+    assert _stored_bpms(reopened, aid) == [100, 101, 102, 103, 104]
+    reopened.close()
+
+
+def _record_activity(db: DatabaseManager, bpms: list[int]) -> int:
+    aid = db.start_activity(SportTypesEnum.running)
+    for i, bpm in enumerate(bpms):
+        db.insert_heart_rate(aid, i * 1000, bpm, None, None)
+    db.stop_activity(aid)
+    return aid
+
+
+def _bpms_by_start(db: DatabaseManager) -> dict:
+    with db.Session() as session:
+        rows = session.execute(
+            select(Activity.start_time, HeartRate.bpm)
+            .join(HeartRate, HeartRate.activity_id == Activity.id)
+            .order_by(Activity.start_time, HeartRate.timestamp_ms),
+        ).all()
+    series: dict = {}
+    for start, bpm in rows:
+        series.setdefault(start, []).append(bpm)
+    return series
+
+
+def _activity_count(db: DatabaseManager) -> int:
+    with db.Session() as session:
+        return session.scalar(select(func.count()).select_from(Activity))
+
+
+def test_sync_between_sqlite_databases_remaps_ids_without_duplicates(tmp_path: Path) -> None:
+    local = DatabaseManager(f"sqlite:///{tmp_path / 'local.db'}")
+    remote_url = f"sqlite:///{tmp_path / 'remote.db'}"
+    remote = DatabaseManager(remote_url)
+
+    # the remote's own activity takes id 1, so local ids must be remapped
+    _record_activity(remote, [90, 91])
+    _record_activity(local, [120, 121, 122])
+    _record_activity(local, [140, 141])
+
+    local.sync_to_database(remote_url)
+
+    assert _activity_count(remote) == 3
+    assert _activity_count(local) == 3
+    # every activity has the same samples on both sides, under its own id
+    assert _bpms_by_start(local) == _bpms_by_start(remote)
+    assert sorted(_bpms_by_start(remote).values()) == [[90, 91], [120, 121, 122], [140, 141]]
+
+    local.sync_to_database(remote_url)
+
+    assert _activity_count(remote) == 3
+    assert _activity_count(local) == 3
+    with remote.Session() as session:
+        assert session.scalar(select(func.count()).select_from(HeartRate)) == 7
+    local.close()
+    remote.close()
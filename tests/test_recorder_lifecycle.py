@@ -241,6 +241,17 @@ class RecorderLifecycleTests(unittest.TestCase):
         retry_task.cancel.assert_called_once_with()
         recorder.shutdown()
 
+    def test_median_bpm_warms_up_then_takes_the_median_of_three(self):
+        recorder = _make_recorder(test_mode=True)
+        expected = []
+        for bpm in (120, 131, 200, 125, 90):
+            recorder._bpm_history.append(bpm)
+            expected.append(recorder._median_bpm())
+
+        # one reading, mean of two, then the median of the last three
+        self.assertEqual(expected, [120, 125, 131, 131, 125])
+        recorder.shutdown()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,134 @@
+# ruff: noqa: SLF001
+
+import numpy as np
+from fitness_tracker.series import SampleWindow, decimate, rolling
+
+
+def _naive_rolling_mean(ys: list[float | None], window: int) -> list[float]:
+    half = window // 2
+    out = []
+    for i in range(len(ys)):
+        seg = [v for v in ys[max(0, i - half) : i + half + 1] if v is not None]
+        out.append(sum(seg) / len(seg) if seg else np.nan)
+    return out
+
+
+def _fill(window: SampleWindow, times: range) -> None:
+    for t in times:
+        window.append(t, 100 + t, 200 + t)
+
+
+def test_sample_window_exposes_columns_in_order() -> None:
+    window = SampleWindow(capacity=8)
+    _fill(window, range(3))
+
+    assert len(window) == 3
+    assert window.times.tolist() == [0, 1, 2]
+    assert window.bpms.tolist() == [100, 101, 102]
+    assert window.powers.tolist() == [200, 201, 202]
+
+
+def test_sample_window_trim_before_drops_old_samples() -> None:
+    window = SampleWindow(capacity=8)
+    _fill(window, range(5))
+
+    window.trim_before(3)
+
+    assert window.times.tolist() == [3, 4]
+    assert window.bpms.tolist() == [103, 104]
+
+
+def test_sample_window_trim_past_every_sample_empties_it() -> None:
+    window = SampleWindow(capacity=8)
+    _fill(window, range(3))
+
+    window.trim_before(10)
+
+    assert len(window) == 0
+    assert window.times.size == 0
+    window.trim_before(20)
+    assert len(window) == 0
+
+
+def test_sample_window_compacts_at_the_end_of_the_buffer() -> None:
+    window = SampleWindow(capacity=4)
+    _fill(window, range(4))
+    window.trim_before(3)
+
+    # the write position is at the end, but one live sample fits at the front
+    window.append(4, 104, 204)
+
+    assert window._data.shape[1] == 4
+    assert window._start == 0
+    assert window.times.tolist() == [3, 4]
+    assert window.powers.tolist() == [203, 204]
+
+
+def test_sample_window_grows_when_the_window_outgrows_the_buffer() -> None:
+    window = SampleWindow(capacity=4)
+    _fill(window, range(10))
+
+    assert len(window) == 10
+    assert window._data.shape[1] >= 10
+    np.testing.assert_array_equal(window.times, np.arange(10))
+    np.testing.assert_array_equal(window.bpms, np.arange(10) + 100)
+
+
+def test_sample_window_clear_keeps_the_buffer() -> None:
+    window = SampleWindow(capacity=4)
+    _fill(window, range(3))
+
+    window.clear()
+    window.append(7, 107, 207)
+
+    assert window._data.shape[1] == 4
+    assert window.times.tolist() == [7]
+
+
+def test_rolling_empty_input_returns_empty_array() -> None:
+    assert rolling([], 5).size == 0
+
+
+def test_rolling_window_of_one_returns_values_unchanged() -> None:
+    np.testing.assert_array_equal(rolling([1.0, None, 3.0], 1), [1.0, np.nan, 3.0])
+
+
+def test_rolling_mean_matches_a_naive_window_and_skips_gaps() -> None:
+    ys = [None, None, 10.0, 20.0, None, 40.0, 50.0, None, None, None, None, 90.0]
+
+    for window in (3, 4, 5):
+        np.testing.assert_allclose(rolling(ys, window), _naive_rolling_mean(ys, window))
+
+
+def test_rolling_window_longer_than_series_averages_everything() -> None:
+    np.testing.assert_allclose(rolling([1.0, 2.0, None, 6.0], 50), [3.0, 3.0, 3.0, 3.0])
+
+
+def test_rolling_bins_without_samples_stay_nan() -> None:
+    out = rolling([None, None, None, None, None, 5.0], 3)
+
+    assert np.isnan(out[:4]).all()
+    assert out[4:].tolist() == [5.0, 5.0]
+
+
+def test_rolling_median() -> None:
+    out = rolling([1.0, 100.0, 2.0, 3.0, None], 3, use_median=True)
+
+    assert out.tolist() == [50.5, 2.0, 3.0, 2.5, 3.0]
+
+
+def test_decimate_short_series_is_untouched() -> None:
+    xs, ys = decimate(np.arange(5), [1, 2, None, 4, 5], 10)
+
+    assert xs.tolist() == [0, 1, 2, 3, 4]
+    np.testing.assert_array_equal(ys, [1, 2, np.nan, 4, 5])
+
+
+def test_decimate_strides_to_target_and_keeps_last_sample() -> None:
+    xs, ys = decimate(np.arange(1001), np.arange(1001) * 2.0, 100)
+
+    assert len(xs) <= 101
+    assert xs[0] == 0
+    assert xs[-1] == 1000
+    assert ys[-1] == 2000
+    assert np.all(np.diff(xs) > 0)